@@ -6,6 +6,8 @@ extra_compile_args = ["-std=c99"]
 if sys.platform == "darwin":
     extra_compile_args.append("-mmacosx-version-min=10.9")
     print("Using macOS clang args")
+# Cython is required to build extensions (see setup_requires); generated C
+# sources are not tracked
 ext_modules = [
     Extension(
         "remora.encoded_kmers",
@@ -19,6 +21,12 @@ ext_modules = [
         extra_compile_args=extra_compile_args,
         language="c",
     ),
+    Extension(
+        "remora.cigar_core",
+        sources=["src/remora/cigar_core.pyx"],
+        extra_compile_args=extra_compile_args,
+        language="c",
+    ),
 ]
 
 
@@ -0,0 +1,87 @@
+# cython: language_level=3
+# cython: boundscheck=False
+# cython: wraparound=False
+
+import numpy as np
+
+from libc.stdint cimport int64_t
+
+
+# CIGAR operations which correspond to query and reference sequence
+#  ["M", "I", "D", "N", "S", "H", "P", "=", "X"]
+cdef inline bint is_match_op(int op):
+    return op == 0 or op == 7 or op == 8
+
+
+cdef inline bint is_query_op(int op):
+    return op == 0 or op == 1 or op == 4 or op == 7 or op == 8
+
+
+cdef inline bint is_ref_op(int op):
+    return op == 0 or op == 2 or op == 3 or op == 7 or op == 8
+
+
+def cigar_to_ref_to_query_knots(cigar, int64_t ref_len):
+    """Map each reference position to a query position by walking the CIGAR
+    operations. Knots are placed at the first and last position of each
+    match operation and positions between knots are linearly interpolated,
+    giving the same result as np.interp over these knots followed by
+    truncation to integers.
+
+    Args:
+        cigar (list): pysam-style list of (op, count) tuples
+        ref_len (int): Length of reference sequence
+
+    Returns:
+        int64 np.ndarray with shape (ref_len + 1,)
+    """
+    cdef int num_ops = len(cigar)
+    cdef int64_t[::1] ref_knots = np.empty(2 * num_ops + 2, dtype=np.int64)
+    cdef int64_t[::1] query_knots = np.empty(2 * num_ops + 2, dtype=np.int64)
+    cdef int op
+    cdef int64_t op_len
+    cdef int64_t ref_pos = 0
+    cdef int64_t query_pos = 0
+    cdef int num_knots = 1
+    ref_knots[0] = 0
+    query_knots[0] = 0
+    for op, op_len in cigar:
+        if is_match_op(op):
+            ref_knots[num_knots] = ref_pos
+            query_knots[num_knots] = query_pos
+            ref_knots[num_knots + 1] = ref_pos + op_len - 1
+            query_knots[num_knots + 1] = query_pos + op_len - 1
+            num_knots += 2
+        if is_ref_op(op):
+            ref_pos += op_len
+        if is_query_op(op):
+            query_pos += op_len
+    ref_knots[num_knots] = ref_pos
+    query_knots[num_knots] = query_pos
+    num_knots += 1
+
+    knots = np.empty(ref_len + 1, dtype=np.int64)
+    cdef int64_t[::1] knots_view = knots
+    cdef int64_t last_ref = ref_knots[num_knots - 1]
+    cdef int64_t last_query = query_knots[num_knots - 1]
+    cdef int64_t pos
+    cdef double slope
+    # index of last knot at or before the current reference position
+    cdef int knot_idx = 0
+    for pos in range(ref_len + 1):
+        if pos >= last_ref:
+            knots_view[pos] = last_query
+            continue
+        while ref_knots[knot_idx + 1] <= pos:
+            knot_idx += 1
+        if ref_knots[knot_idx] == pos:
+            knots_view[pos] = query_knots[knot_idx]
+            continue
+        slope = <double>(
+            query_knots[knot_idx + 1] - query_knots[knot_idx]
+        ) / <double>(ref_knots[knot_idx + 1] - ref_knots[knot_idx])
+        knots_view[pos] = <int64_t>(
+            slope * <double>(pos - ref_knots[knot_idx])
+            + <double>query_knots[knot_idx]
+        )
+    return knots
@@ -10,6 +10,10 @@ DEFAULT_EPOCHS = 50
 DEFAULT_WEIGHT_DECAY = 1e-4
 DEFAULT_FILT_FRAC = 0.1
 DEFAULT_LR = 0.001
+DEFAULT_BAM_READ_THREADS = 4
+DEFAULT_BAM_WRITE_THREADS = 4
+FULL_RESULTS_BUFFER_SIZE = 2**20
+POD5_READ_BATCH_SIZE = 512
 FOCUS_OFFSET=31
 BEG_KNOWN_SEQ='GAATTC'
 END_KNOWN_SEQ='TCTAGA'
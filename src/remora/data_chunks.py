@@ -8,7 +8,14 @@ import numpy as np
 from tqdm import tqdm
 
 from remora.refine_signal_map import SigMapRefiner
-from remora import constants, log, RemoraError, util, encoded_kmers
+from remora import (
+    constants,
+    log,
+    RemoraError,
+    util,
+    encoded_kmers,
+    cigar_core,
+)
 
 LOGGER = log.get_logger()
 
@@ -20,13 +27,6 @@ MISMATCH_ARRS = {
     2: np.array([0, 1, 3]),
     3: np.array([0, 1, 2]),
 }
-# CIGAR operations which correspond to query and reference sequence
-MATCH_OPS = np.array(
-    [True, False, False, False, False, False, False, True, True]
-)
-QUERY_OPS = np.array([True, True, False, False, True, False, False, True, True])
-#                    ["M", "I",   "D",   "N", "S",   "H",    "P", "=", "X"]
-REF_OPS = np.array([True, False, True, True, False, False, False, True, True])
 CIGAR_CODES = ["M", "I", "D", "N", "S", "H", "P", "=", "X"]
 CODE_TO_OP = {
     "M": 0,
@@ -68,8 +68,9 @@ def compute_ref_to_signal(query_to_signal, cigar, *, query_seq, ref_seq):
     ref_to_read_knots = make_sequence_coordinate_mapping(
         cigar=cigar, read_seq=query_seq, ref_seq=ref_seq
     )
-    return map_ref_to_signal(
-        query_to_signal=query_to_signal, ref_to_query_knots=ref_to_read_knots
+    # knots are integer query positions, so interpolation reduces to indexing
+    return query_to_signal.take(ref_to_read_knots, mode="clip").astype(
+        int, copy=False
     )
 
 
@@ -86,25 +87,9 @@ def make_sequence_coordinate_mapping(
     :return: array shape (len(ref_seq),). [x_0, x_1, ..., x_(len(ref_seq))]
              such that read_seq[x_i] <> ref_seq[i]
     """
-    ops, lens = map(np.array, zip(*cigar))
     ref_len = len(ref_seq)
     read_len = len(read_seq)
-
-    is_match = MATCH_OPS[ops]
-    match_counts = lens[is_match]
-    offsets = np.array([match_counts, np.ones_like(match_counts)])
-
-    ref_knots = np.cumsum(np.where(REF_OPS[ops], lens, 0))
-    ref_knots = np.concatenate(
-        [[0], (ref_knots[is_match] - offsets).T.flatten(), [ref_knots[-1]]]
-    )
-    query_knots = np.cumsum(np.where(QUERY_OPS[ops], lens, 0))
-    query_knots = np.concatenate(
-        [[0], (query_knots[is_match] - offsets).T.flatten(), [query_knots[-1]]]
-    )
-    knots = np.interp(np.arange(ref_len + 1), ref_knots, query_knots).astype(
-        int
-    )
+    knots = cigar_core.cigar_to_ref_to_query_knots(cigar, ref_len)
 
     # +1 because knots include the end position of the last base
     assert knots.shape[0] == ref_len + 1, "knots should be len(ref_seq) + 1"
@@ -320,7 +305,7 @@ class RemoraRead:
         Mutates self. Sets self.focus_bases to all hits within self.int_seq.
         :param motifs: Iterable of util.Motifs
         """
-        self.focus_bases = np.array([i for i in range(len(self.int_seq))],dtype=int)
+        self.focus_bases = np.arange(self.int_seq.size)
 
     def downsample_focus_bases(self, max_sites):
         if self.focus_bases is not None and self.focus_bases.size > max_sites:
@@ -494,9 +479,7 @@ class RemoraRead:
             shuffle_on_iter=False,
             drop_last=False,
         )
-
-        for chunk in chunks:
-            dataset.add_chunk(chunk)
+        dataset.add_chunks(chunks)
         dataset.set_nbatches()
 
         bb, ab = model_metadata["kmer_context_bases"]
@@ -506,11 +489,12 @@ class RemoraRead:
             )
             self.batches.append((sigs, enc_kmers, labels, read_pos))
 
-    def run_model(self, model):
+    def run_model(self, model, batch_size=None):
         """Call modified bases on a read.
 
         Args:
             model: Compiled inference model (see remora.model_util.load_model)
+            batch_size (int): Batch size used to prepare batches
 
         Returns:
             3-tuple containing:
@@ -518,24 +502,235 @@ class RemoraRead:
               2. Labels for each base (-1 if labels not provided)
               3. List of positions within the read
         """
-        device = next(model.parameters()).device
-        read_outputs, read_poss, read_labels = [], [], []
-        for sigs, enc_kmers, labels, read_pos in self.batches:
-            read_outputs.append(
-                model.forward(
-                    sigs=torch.from_numpy(sigs).to(device),
-                    seqs=torch.from_numpy(enc_kmers).to(device),
+        read_outputs = run_model_on_batches(
+            model,
+            ((sigs, enc_kmers) for sigs, enc_kmers, _, _ in self.batches),
+            self.num_batched_chunks,
+            batch_size,
+        )
+        read_labels = np.concatenate([batch[2] for batch in self.batches])
+        read_poss = np.concatenate([batch[3] for batch in self.batches])
+        return read_outputs, read_labels, read_poss
+
+    @property
+    def num_batched_chunks(self):
+        if self.batches is None:
+            return 0
+        return sum(batch[0].shape[0] for batch in self.batches)
+
+
+def pad_batch_size(num_chunks, batch_size):
+    """Size to which a partial batch is padded on GPU devices. Padding to
+    powers of two bounds the number of distinct input shapes, so cuDNN
+    benchmarking runs a handful of times instead of once per partial batch
+    size.
+
+    Args:
+        num_chunks (int): Number of chunks in batch
+        batch_size (int): Full batch size
+
+    Returns:
+        Padded number of chunks
+    """
+    pow2_size = 1 << (num_chunks - 1).bit_length()
+    return min(pow2_size, max(batch_size, num_chunks))
+
+
+def run_model_on_batches(model, batches, num_chunks, batch_size=None):
+    """Run model over batches of inputs.
+
+    On GPU devices inputs are staged through two alternating sets of reused
+    pinned host and device buffers and copied to the device on a separate
+    stream, so that the transfer of the next batch overlaps with the forward
+    pass of the current batch. Inputs are cast to
+    the model precision and outputs are returned in single precision.
+
+    Outputs are written directly into a single (pinned on GPU devices) host
+    buffer allocated on the first batch.
+
+    Args:
+        model: Compiled inference model (see remora.model_util.load_model)
+        batches (iterable): Signal and encoded k-mer array pairs
+        num_chunks (int): Total number of chunks over all batches
+        batch_size (int): Full batch size. If provided, partial batches are
+            padded on GPU devices (see pad_batch_size).
+
+    Returns:
+        Model output (dim: num_chunks, num_mods + 1)
+    """
+    model_param = next(model.parameters())
+    device, dtype = model_param.device, model_param.dtype
+    on_gpu = device.type == "cuda"
+    outputs = None
+    out_st = 0
+
+    def store_output(output):
+        nonlocal outputs, out_st
+        if outputs is None:
+            outputs = torch.empty(
+                (num_chunks,) + tuple(output.shape[1:]),
+                dtype=torch.float32,
+                pin_memory=on_gpu,
+            )
+        out_en = out_st + output.shape[0]
+        outputs[out_st:out_en].copy_(output, non_blocking=on_gpu)
+        out_st = out_en
+
+    if not on_gpu:
+        with torch.inference_mode():
+            for sigs, enc_kmers in batches:
+                store_output(
+                    model.forward(
+                        sigs=torch.from_numpy(sigs).to(device, dtype),
+                        seqs=torch.from_numpy(enc_kmers).to(device, dtype),
+                    )
                 )
-                .detach()
-                .cpu()
-                .numpy()
+        return outputs.numpy()
+
+    copy_stream = torch.cuda.Stream(device)
+    compute_stream = torch.cuda.current_stream(device)
+    # two sets of pinned host and device input buffers are alternated so the
+    # next batch is staged while the current batch is processed. Events mark
+    # when a host buffer has been copied to the device and when a device
+    # buffer has been consumed by the model.
+    buffers = [None, None]
+    copied = [None, None]
+    consumed = [None, None]
+
+    def stage_batch(batch, buf_idx):
+        if batch is None:
+            return None
+        nchunks = batch[0].shape[0]
+        pad_size = (
+            nchunks
+            if batch_size is None
+            else pad_batch_size(nchunks, batch_size)
+        )
+        if copied[buf_idx] is not None:
+            copied[buf_idx].synchronize()
+        if (
+            buffers[buf_idx] is None
+            or buffers[buf_idx][0][0].shape[0] < pad_size
+        ):
+            if consumed[buf_idx] is not None:
+                consumed[buf_idx].synchronize()
+            buf_size = max(pad_size, batch_size or 0)
+            buffers[buf_idx] = [
+                (
+                    torch.zeros(
+                        (buf_size,) + arr.shape[1:],
+                        dtype=torch.float32,
+                        pin_memory=True,
+                    ),
+                    torch.empty(
+                        (buf_size,) + arr.shape[1:],
+                        dtype=dtype,
+                        device=device,
+                    ),
+                )
+                for arr in batch
+            ]
+            # device buffers are allocated on the compute stream, so order
+            # the copies after any prior compute stream use of that memory
+            copy_stream.wait_stream(compute_stream)
+        # padded rows keep stale values and their outputs are discarded
+        for arr, (host_buf, _) in zip(batch, buffers[buf_idx]):
+            host_buf[:nchunks].copy_(torch.from_numpy(arr))
+        with torch.cuda.stream(copy_stream):
+            if consumed[buf_idx] is not None:
+                copy_stream.wait_event(consumed[buf_idx])
+            for host_buf, dev_buf in buffers[buf_idx]:
+                dev_buf[:pad_size].copy_(host_buf[:pad_size], non_blocking=True)
+            copied[buf_idx] = copy_stream.record_event()
+        return nchunks, pad_size
+
+    batches = iter(batches)
+    buf_idx = 0
+    with torch.inference_mode():
+        staged = stage_batch(next(batches, None), buf_idx)
+        while staged is not None:
+            nchunks, pad_size = staged
+            compute_stream.wait_event(copied[buf_idx])
+            sigs, enc_kmers = (
+                dev_buf[:pad_size] for _, dev_buf in buffers[buf_idx]
             )
-            read_labels.append(labels)
-            read_poss.append(read_pos)
-        read_outputs = np.concatenate(read_outputs, axis=0)
-        read_labels = np.concatenate(read_labels)
-        read_poss = np.concatenate(read_poss)
-        return read_outputs, read_labels, read_poss
+            staged = stage_batch(next(batches, None), 1 - buf_idx)
+            store_output(
+                model.forward(sigs=sigs, seqs=enc_kmers)[:nchunks].float()
+            )
+            consumed[buf_idx] = compute_stream.record_event()
+            buf_idx = 1 - buf_idx
+        torch.cuda.synchronize(device)
+    return outputs.numpy()
+
+
+def run_model_on_reads(reads, model, batch_size):
+    """Call modified bases on several reads at once. Full batches prepared
+    for each read are passed to the model directly, while the final partial
+    batch from each read is packed with those from other reads into full
+    batches so that short reads do not each dispatch a mostly empty batch to
+    the model.
+
+    Args:
+        reads (list): RemoraRead objects with prepared batches
+            (see RemoraRead.prepare_batches)
+        model: Compiled inference model (see remora.model_util.load_model)
+        batch_size (int): Number of chunks to call per-batch
+
+    Returns:
+        List containing one 3-tuple for each read as returned from
+        RemoraRead.run_model
+    """
+    if len(reads) == 0:
+        return []
+    num_full = sum(
+        batch[0].shape[0] == batch_size
+        for read in reads
+        for batch in read.batches
+    )
+    # full batches are output first followed by packed partial batches.
+    # Record the start of each batch within the outputs.
+    full_st, part_st = 0, num_full * batch_size
+    reads_batch_sts, part_batches = [], []
+    for read in reads:
+        batch_sts = []
+        for batch in read.batches:
+            if batch[0].shape[0] == batch_size:
+                batch_sts.append(full_st)
+                full_st += batch_size
+            else:
+                batch_sts.append(part_st)
+                part_st += batch[0].shape[0]
+                part_batches.append(batch)
+        reads_batch_sts.append(batch_sts)
+
+    def iter_batches():
+        for read in reads:
+            for sigs, enc_kmers, _, _ in read.batches:
+                if sigs.shape[0] == batch_size:
+                    yield sigs, enc_kmers
+        if len(part_batches) == 0:
+            return
+        sigs = np.concatenate([batch[0] for batch in part_batches])
+        enc_kmers = np.concatenate([batch[1] for batch in part_batches])
+        for b_st in range(0, sigs.shape[0], batch_size):
+            b_en = b_st + batch_size
+            yield sigs[b_st:b_en], enc_kmers[b_st:b_en]
+
+    outputs = run_model_on_batches(model, iter_batches(), part_st, batch_size)
+    return [
+        (
+            np.concatenate(
+                [
+                    outputs[b_st : b_st + batch[0].shape[0]]
+                    for b_st, batch in zip(batch_sts, read.batches)
+                ]
+            ),
+            np.concatenate([batch[2] for batch in read.batches]),
+            np.concatenate([batch[3] for batch in read.batches]),
+        )
+        for read, batch_sts in zip(reads, reads_batch_sts)
+    ]
 
 
 @dataclass
@@ -763,6 +958,49 @@ class RemoraDataset:
         self.read_focus_bases[self.nchunks] = chunk.read_focus_base
         self.nchunks += 1
 
+    def add_chunks(self, chunks):
+        """Add several chunks at once. Variable width sequence arrays are
+        copied into the allocated tensors with a single masked assignment
+        instead of one slice assignment per chunk.
+        """
+        if len(chunks) == 0:
+            return
+        b_st, b_en = self.nchunks, self.nchunks + len(chunks)
+        if b_en > self.labels.size:
+            raise RemoraError(
+                "Cannot add chunks to currently allocated tensors"
+            )
+        seq_lens = np.fromiter(
+            (chunk.seq_len for chunk in chunks), np.short, len(chunks)
+        )
+        max_seq_len = seq_lens.max()
+        if max_seq_len > self.max_seq_len:
+            raise RemoraError("Chunk sequence too long to store")
+        self.sig_tensor[b_st:b_en, 0] = np.stack(
+            [chunk.signal for chunk in chunks]
+        )
+        # tensors may be allocated wider than the longest sequence among
+        # these chunks, so only mask up to that sequence length
+        ctxt_bases = sum(self.kmer_context_bases)
+        seq_mask = (
+            np.arange(max_seq_len + ctxt_bases)
+            < (seq_lens + ctxt_bases)[:, None]
+        )
+        self.seq_array[b_st:b_en, : max_seq_len + ctxt_bases][
+            seq_mask
+        ] = np.concatenate([chunk.seq_w_context for chunk in chunks])
+        map_mask = np.arange(max_seq_len + 1) <= seq_lens[:, None]
+        self.seq_mappings[b_st:b_en, : max_seq_len + 1][
+            map_mask
+        ] = np.concatenate([chunk.seq_to_sig_map for chunk in chunks])
+        self.seq_lens[b_st:b_en] = seq_lens
+        self.labels[b_st:b_en] = [chunk.label for chunk in chunks]
+        self.read_ids[b_st:b_en] = [chunk.read_id for chunk in chunks]
+        self.read_focus_bases[b_st:b_en] = [
+            chunk.read_focus_base for chunk in chunks
+        ]
+        self.nchunks = b_en
+
     def add_batch(
         self, b_sig, b_seq, b_ss_map, b_seq_lens, b_labels, b_rids, b_rfbs
     ):
@@ -930,7 +1168,7 @@ class RemoraDataset:
 
         else:
             b_st = (self._batch_i - 1) * self.batch_size
-            b_en = b_st + self.batch_size
+            b_en = min(b_st + self.batch_size, self.nchunks)
             return (
                 (
                     self.sig_tensor[b_st:b_en],
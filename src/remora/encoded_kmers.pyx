@@ -15,29 +15,51 @@ def compute_encoded_kmer_batch(
     const signed char[:, ::1] seqs,
     const short[:, ::1] seq_mappings,
     const short[::1] seq_lens,
+    out=None,
 ):
+    """Compute one-hot encoded k-mers for each signal position in a batch.
+
+    If out is provided, the encoding is written into the leading chunks of
+    this preallocated float32 array (dim: >=num_chunks, 4 * kmer_len,
+    sig_len) and a view of the filled chunks is returned. This avoids
+    allocating a new output array for each batch.
+    """
     cdef int nchunks = seq_lens.shape[0]
 
     # initialize output array
     cdef int sig_len = seq_mappings[0, seq_lens[0]]
     cdef int kmer_len = before_context_bases + after_context_bases + 1
     cdef int enc_kmer_len = ENCODING_LEN * kmer_len
-    out_arr = np.zeros((seq_lens.shape[0], enc_kmer_len, sig_len), np.float32)
+    if out is None:
+        out_arr = np.zeros((nchunks, enc_kmer_len, sig_len), np.float32)
+    else:
+        if (
+            out.shape[0] < nchunks
+            or out.shape[1] != enc_kmer_len
+            or out.shape[2] != sig_len
+        ):
+            raise ValueError(
+                f"Output buffer shape {out.shape} cannot hold encoded k-mers "
+                f"({nchunks}, {enc_kmer_len}, {sig_len})"
+            )
+        out_arr = out[:nchunks]
+        out_arr.fill(0)
     cdef float[:, :, ::1] out_mv = out_arr
 
     # loop over chunks, kmer_pos and mappings to fill output array
     cdef int chunk_idx, seq_len, kmer_pos, enc_offset
     cdef int seq_pos, base, base_st, base_en, sig_pos
-    for chunk_idx in range(nchunks):
-        seq_len = seq_lens[chunk_idx]
-        for kmer_pos in range(kmer_len):
-            enc_offset = ENCODING_LEN * kmer_pos
-            for seq_pos in range(seq_len):
-                base = seqs[chunk_idx, seq_pos + kmer_pos]
-                if base == -1:
-                    continue
-                base_st = seq_mappings[chunk_idx, seq_pos]
-                base_en = seq_mappings[chunk_idx, seq_pos + 1]
-                for sig_pos in range(base_st, base_en):
-                    out_mv[chunk_idx, enc_offset + base, sig_pos] = 1.0
+    with nogil:
+        for chunk_idx in range(nchunks):
+            seq_len = seq_lens[chunk_idx]
+            for kmer_pos in range(kmer_len):
+                enc_offset = ENCODING_LEN * kmer_pos
+                for seq_pos in range(seq_len):
+                    base = seqs[chunk_idx, seq_pos + kmer_pos]
+                    if base == -1:
+                        continue
+                    base_st = seq_mappings[chunk_idx, seq_pos]
+                    base_en = seq_mappings[chunk_idx, seq_pos + 1]
+                    for sig_pos in range(base_st, base_en):
+                        out_mv[chunk_idx, enc_offset + base, sig_pos] = 1.0
     return out_arr
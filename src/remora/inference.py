@@ -3,11 +3,12 @@ import itertools
 from copy import copy
 import array as pyarray
 from pathlib import Path
-from typing import Tuple, Any
+from typing import Any, List, Tuple
 from collections import defaultdict
 
 import pod5
 import pysam
+import torch
 import numpy as np
 from tqdm import tqdm
 from torch.jit._script import RecursiveScriptModule
@@ -15,26 +16,32 @@ from torch.jit._script import RecursiveScriptModule
 from remora import constants, log, RemoraError
 from remora.io import (
     index_bam,
+    cached_index_bam,
     iter_signal,
     prep_extract_alignments,
     extract_alignments,
+    sam_str_to_dict,
     DuplexRead,
     Read as IoRead,
     DuplexPairsBuilder,
 )
+from remora.data_chunks import run_model_on_reads
 from remora.util import (
     MultitaskMap,
     BackgroundIter,
+    catch_read_errors,
+    maybe_profile,
     format_mm_ml_tags,
-    softmax_axis1,
+    softmax_axis1_mod_probs,
     Motif,
     revcomp,
+    DEFAULT_QUEUE_SIZE,
+    BATCH_QUEUE_SIZE,
 )
 
 LOGGER = log.get_logger()
-_PROF_PREP_FN = os.getenv("REMORA_INFER_PREP_DATA_PROFILE_FILE")
-_PROF_MODEL_FN = os.getenv("REMORA_INFER_RUN_MODEL_PROFILE_FILE")
-_PROF_MAIN_FN = os.getenv("REMORA_INFER_MAIN_PROFILE_FILE")
+# SAM tag prefixes replaced by Remora calls
+_MOD_TAG_PREFIXES = ("MM", "ML")
 
 
 ################
@@ -81,10 +88,10 @@ def call_read_mods(
     read.prepare_batches(model_metadata, batch_size)
     if len(read.batches) == 0:
         return np.array([]), np.array([]), np.array([])
-    nn_out, labels, pos = read.run_model(model)
+    nn_out, labels, pos = read.run_model(model, batch_size)
     if not return_mod_probs and not return_mm_ml_tags:
         return nn_out, labels, pos
-    probs = softmax_axis1(nn_out)[:, 1:].astype(np.float64)
+    probs = softmax_axis1_mod_probs(nn_out)
     if return_mm_ml_tags:
         return format_mm_ml_tags(
             seq=read.str_seq,
@@ -201,6 +208,7 @@ def mods_tags_to_str(mods_tags):
     ]
 
 
+@maybe_profile("REMORA_INFER_PREP_DATA_PROFILE_FILE")
 def prepare_batches(read_errs, model_metadata, batch_size, ref_anchored):
     out_read_errs = []
     for io_read, err in read_errs:
@@ -219,71 +227,196 @@ def prepare_batches(read_errs, model_metadata, batch_size, ref_anchored):
         if len(remora_read.batches) == 0:
             out_read_errs.append((None, None, "No mod calls"))
             continue
-        out_read_errs.append((copy(io_read), remora_read, None))
+        out_read_errs.append((io_read.copy(), remora_read, None))
     return out_read_errs
 
 
-if _PROF_PREP_FN:
-    _prepare_batches_wrapper = prepare_batches
+class ReadGroups:
+    """Iterable grouping prepared reads such that each group contains enough
+    chunks to fill at least one batch. Groups are formed by the task iterating
+    over this object (the inference input filler), so prepared reads do not
+    pass through an additional process.
 
-    def prepare_batches(*args, **kwargs):
-        import cProfile
+    Args:
+        read_errs_iter: Iterator over output from prepare_batches
+        batch_size (int): Number of chunks to call per-batch
+    """
 
-        prof = cProfile.Profile()
-        retval = prof.runcall(_prepare_batches_wrapper, *args, **kwargs)
-        prof.dump_stats(_PROF_PREP_FN)
-        return retval
+    def __init__(self, read_errs_iter, batch_size):
+        self.read_errs_iter = read_errs_iter
+        self.batch_size = batch_size
+
+    def __iter__(self):
+        group, group_nchunks = [], 0
+        for read_errs in self.read_errs_iter:
+            group.append(read_errs)
+            group_nchunks += sum(
+                remora_read.num_batched_chunks
+                for _, remora_read, err in read_errs
+                if err is None
+            )
+            if group_nchunks >= self.batch_size:
+                yield group
+                group, group_nchunks = [], 0
+        if len(group) > 0:
+            yield group
 
 
-def run_model(read_errs, model, model_metadata, ref_anchored):
-    out_read_errs = []
-    for io_read, remora_read, err in read_errs:
-        if err is not None:
-            print('err is not none')
-            out_read_errs.append((None, err))
-            continue
-        # TODO super-batch reads to optimize performance for short reads
-        nn_out, labels, pos = remora_read.run_model(model)
-        probs = softmax_axis1(nn_out)[:, 1:].astype(np.float64)
-        mod_tags = mods_tags_to_str(
-            format_mm_ml_tags(
-                seq=remora_read.str_seq,
-                poss=pos,
-                probs=probs,
-                mod_bases=model_metadata["mod_bases"],
-                can_base=model_metadata["can_base"],
+def prep_cpu_infer_worker(*args, num_workers, **kwargs):
+    """Limit torch intra-op threads within a CPU inference worker process so
+    that concurrent workers share the available cores instead of each
+    starting one thread per core.
+
+    Args:
+        num_workers (int): Number of concurrent inference worker processes
+    """
+    torch.set_num_threads(max(1, (os.cpu_count() or 1) // num_workers))
+    return args, kwargs
+
+
+@catch_read_errors
+def run_model_on_read(remora_read, model, batch_size):
+    """Run model on a single prepared read.
+
+    Returns:
+        2-tuple containing output from RemoraRead.run_model and error
+    """
+    return run_model_on_reads([remora_read], model, batch_size)[0], None
+
+
+@maybe_profile("REMORA_INFER_RUN_MODEL_PROFILE_FILE")
+def run_model(reads_read_errs, model, batch_size):
+    """Run model on a group of prepared reads. Chunks from all reads in the
+    group are packed into full batches. If calling the group fails, reads are
+    called separately so that an error is attributed only to the read(s)
+    causing it.
+
+    Args:
+        reads_read_errs: Group of reads from ReadGroups
+        model: Compiled inference model
+        batch_size (int): Number of chunks to call per-batch
+
+    Returns:
+        List with one list per input read containing 3-tuples with IO read
+        fields (see mod_tags_read_fields), model outputs (sequence, neural
+        network output and positions within sequence) and error
+    """
+    remora_reads = [
+        remora_read
+        for read_errs in reads_read_errs
+        for _, remora_read, err in read_errs
+        if err is None
+    ]
+    try:
+        reads_outputs = [
+            (read_outputs, None)
+            for read_outputs in run_model_on_reads(
+                remora_reads, model, batch_size
             )
+        ]
+    except Exception as e:
+        LOGGER.debug(
+            f"Calling group of {len(remora_reads)} reads failed ('{e}'), "
+            "calling reads separately"
         )
-        io_read.full_align["tags"] = [
-            tag
-            for tag in io_read.full_align["tags"]
-            if not (tag.startswith("MM") or tag.startswith("ML"))
+        reads_outputs = [
+            run_model_on_read(remora_read, model, batch_size)
+            for remora_read in remora_reads
         ]
-        io_read.full_align["tags"].extend(mod_tags)
-        if ref_anchored:
-            io_read.full_align["cigar"] = f"{len(io_read.ref_seq)}M"
-            io_read.full_align["seq"] = (
-                io_read.ref_seq
-                if io_read.ref_pos.strand == "+"
-                else revcomp(io_read.ref_seq)
+    reads_outputs = iter(reads_outputs)
+    out_reads_read_outputs = []
+    for read_errs in reads_read_errs:
+        out_read_outputs = []
+        for io_read, remora_read, err in read_errs:
+            if err is not None:
+                out_read_outputs.append((None, None, err))
+                continue
+            read_outputs, err = next(reads_outputs)
+            if err is not None:
+                out_read_outputs.append((None, None, err))
+                continue
+            nn_out, _, pos = read_outputs
+            out_read_outputs.append(
+                (
+                    mod_tags_read_fields(io_read),
+                    (remora_read.str_seq, nn_out, pos),
+                    None,
+                )
             )
-            io_read.full_align["qual"] = "*"
-        out_read_errs.append((io_read, None))
-    return out_read_errs
+        out_reads_read_outputs.append(out_read_outputs)
+    return out_reads_read_outputs
+
 
+def mod_tags_read_fields(io_read):
+    """Extract the fields of an io.Read required to add modified base tags.
+    Only these fields are passed to add_mod_tags workers, which avoids
+    pickling the signal and mapping arrays of each read between processes.
+
+    Args:
+        io_read (io.Read): Read to extract fields from
 
-if _PROF_MODEL_FN:
-    _run_model_wrapper = run_model
+    Returns:
+        4-tuple containing SAM record string, reference sequence, reference
+        strand and signal length
+    """
+    return (
+        io_read.full_align_str,
+        io_read.ref_seq,
+        None if io_read.ref_pos is None else io_read.ref_pos.strand,
+        io_read.signal.size,
+    )
 
-    def run_model(*args, **kwargs):
-        import cProfile
 
-        prof = cProfile.Profile()
-        retval = prof.runcall(_run_model_wrapper, *args, **kwargs)
-        prof.dump_stats(_PROF_MODEL_FN)
-        return retval
+def add_mod_tags(reads_read_outputs, model_metadata, ref_anchored):
+    """Add modified base tags to alignment records.
 
+    Args:
+        reads_read_outputs: Output from run_model
+        model_metadata (dict): Model metadata
+        ref_anchored (bool): Output reference anchored records
 
+    Returns:
+        List with one list per input read containing 2-tuples with
+        2-tuple (alignment record dict and signal length) and error
+    """
+    out_reads_read_errs = []
+    for read_outputs in reads_read_outputs:
+        out_read_errs = []
+        for read_fields, outputs, err in read_outputs:
+            if err is not None:
+                out_read_errs.append((None, err))
+                continue
+            full_align_str, ref_seq, strand, sig_len = read_fields
+            seq, nn_out, pos = outputs
+            probs = softmax_axis1_mod_probs(nn_out)
+            mod_tags = mods_tags_to_str(
+                format_mm_ml_tags(
+                    seq=seq,
+                    poss=pos,
+                    probs=probs,
+                    mod_bases=model_metadata["mod_bases"],
+                    can_base=model_metadata["can_base"],
+                )
+            )
+            full_align = sam_str_to_dict(full_align_str)
+            full_align["tags"] = [
+                tag
+                for tag in full_align["tags"]
+                if not tag.startswith(_MOD_TAG_PREFIXES)
+            ]
+            full_align["tags"].extend(mod_tags)
+            if ref_anchored:
+                full_align["cigar"] = f"{len(ref_seq)}M"
+                full_align["seq"] = (
+                    ref_seq if strand == "+" else revcomp(ref_seq)
+                )
+                full_align["qual"] = "*"
+            out_read_errs.append(((full_align, sig_len), None))
+        out_reads_read_errs.append(out_read_errs)
+    return out_reads_read_errs
+
+
+@maybe_profile("REMORA_INFER_MAIN_PROFILE_FILE")
 def infer_from_pod5_and_bam(
     pod5_path,
     in_bam_path,
@@ -297,8 +430,15 @@ def infer_from_pod5_and_bam(
     batch_size=constants.DEFAULT_BATCH_SIZE,
     skip_non_primary=True,
     ref_anchored=False,
+    cache_bam_index=False,
+    reference_fasta=None,
 ):
-    bam_idx, num_bam_reads = index_bam(in_bam_path, skip_non_primary)
+    index_func = cached_index_bam if cache_bam_index else index_bam
+    bam_idx, num_bam_reads = index_func(
+        in_bam_path,
+        skip_non_primary,
+        num_workers=num_extract_alignment_workers,
+    )
     with pod5.Reader(Path(pod5_path)) as pod5_fh:
         pod5_read_ids = set((str(read.read_id) for read in pod5_fh.reads()))
         # pod5 will raise when it cannot find a "selected" read id, so we make
@@ -331,7 +471,7 @@ def infer_from_pod5_and_bam(
         prep_func=prep_extract_alignments,
         num_workers=num_extract_alignment_workers,
         args=(bam_idx, in_bam_path),
-        kwargs={"req_tags": {"mv"}},
+        kwargs={"req_tags": {"mv"}, "ref_path": reference_fasta},
         name="AddAlignments",
         use_process=True,
     )
@@ -346,16 +486,39 @@ def infer_from_pod5_and_bam(
 
     use_process = True
     if isinstance(model, RecursiveScriptModule):
-        use_process = next(model.parameters()).device.type == "cpu"
-
-    mod_reads_mappings = MultitaskMap(
+        device_type = next(model.parameters()).device.type
+        use_process = device_type == "cpu"
+        if device_type == "cuda":
+            # inference batches have a fixed set of shapes (see
+            # data_chunks.run_model_on_batches) so select the fastest cuDNN
+            # algorithms once per shape
+            torch.backends.cudnn.benchmark = True
+
+    # each read group fills at least one batch, so scale queues of read groups
+    # to hold about DEFAULT_QUEUE_SIZE chunks
+    group_q_maxsize = max(1, DEFAULT_QUEUE_SIZE // batch_size)
+    # GPU models are driven by a single worker since read groups already
+    # fill batches and multiple workers would contend for the device
+    reads_outputs = MultitaskMap(
         run_model,
-        reads,
-        num_workers=num_infer_workers,
-        args=(model, model_metadata, ref_anchored),
+        ReadGroups(reads, batch_size),
+        q_maxsize=group_q_maxsize,
+        prep_func=prep_cpu_infer_worker if use_process else None,
+        num_workers=num_infer_workers if use_process else 1,
+        args=(model, batch_size),
+        kwargs={"num_workers": num_infer_workers} if use_process else {},
         name="InferMods",
         use_process=use_process,
     )
+    mod_reads_mappings = MultitaskMap(
+        add_mod_tags,
+        reads_outputs,
+        num_workers=num_infer_workers,
+        args=(model_metadata, ref_anchored),
+        q_maxsize=group_q_maxsize,
+        name="AddModTags",
+        use_process=True,
+    )
 
     errs = defaultdict(int)
     pysam_save = pysam.set_verbosity(0)
@@ -363,34 +526,45 @@ def infer_from_pod5_and_bam(
     in_bam = out_bam = pbar = None
     try:
         in_bam = pysam.AlignmentFile(in_bam_path, "rb", check_sq = False)
-        out_bam = pysam.AlignmentFile(out_bam_path, "wb", template=in_bam)
+        out_bam = pysam.AlignmentFile(
+            out_bam_path,
+            "wb",
+            template=in_bam,
+            threads=constants.DEFAULT_BAM_WRITE_THREADS,
+        )
+        out_header, write_aln = out_bam.header, out_bam.write
         pbar = tqdm(
             smoothing=0,
             total=num_reads,
             unit=" Reads",
             desc="Inferring mods",
         )
-        for read_errs in mod_reads_mappings:
-            pbar.update()
-            if len(read_errs) == 0:
-                errs["No valid mappings"] += 1
-                continue
-
-            sig_called += sum(
-                read.signal.size for read, _ in read_errs if read is not None
-            )
-            msps = sig_called / 1_000_000 / pbar.format_dict["elapsed"]
-            pbar.set_postfix_str(f"{msps:.2f} Msamps/s", refresh=False)
-
-            for io_read, err in read_errs:
-                if io_read is None:
-                    errs[err] += 1
+        for reads_read_errs in mod_reads_mappings:
+            out_alns = []
+            for read_errs in reads_read_errs:
+                pbar.update()
+                if len(read_errs) == 0:
+                    errs["No valid mappings"] += 1
                     continue
-                out_bam.write(
-                    pysam.AlignedSegment.from_dict(
-                        io_read.full_align, out_bam.header
-                    )
+
+                sig_called += sum(
+                    mod_read[1]
+                    for mod_read, _ in read_errs
+                    if mod_read is not None
                 )
+                msps = sig_called / 1_000_000 / pbar.format_dict["elapsed"]
+                pbar.set_postfix_str(f"{msps:.2f} Msamps/s", refresh=False)
+
+                for mod_read, err in read_errs:
+                    if mod_read is None:
+                        errs[err] += 1
+                        continue
+                    out_alns.append(
+                        pysam.AlignedSegment.from_dict(mod_read[0], out_header)
+                    )
+            # write alignments from each group of reads together
+            for out_aln in out_alns:
+                write_aln(out_aln)
     finally:
         if pbar is not None:
             pbar.close()
@@ -406,18 +580,6 @@ def infer_from_pod5_and_bam(
         LOGGER.info(f"Unsuccessful read reasons:\n{err_str}")
 
 
-if _PROF_MAIN_FN:
-    _infer_from_pod5_and_bam_wrapper = infer_from_pod5_and_bam
-
-    def infer_from_pod5_and_bam(*args, **kwargs):
-        import cProfile
-
-        prof = cProfile.Profile()
-        retval = prof.runcall(_infer_from_pod5_and_bam_wrapper, *args, **kwargs)
-        prof.dump_stats(_PROF_MAIN_FN)
-        return retval
-
-
 def check_simplex_alignments(
     *, simplex_index: dict, duplex_index: dict, pairs: list
 ):
@@ -452,9 +614,9 @@ def prep_duplex_read_builder(simplex_index, pod5_path, simplex_bam_path):
 
 
 def iter_duplexed_io_reads(
-    read_id_pair: Tuple[str, str], builder: DuplexPairsBuilder
+    read_id_pairs: List[Tuple[str, str]], builder: DuplexPairsBuilder
 ):
-    return builder.make_read_pair(read_id_pair)
+    return builder.make_read_pairs(read_id_pairs)
 
 
 def infer_duplex(
@@ -472,16 +634,24 @@ def infer_duplex(
     num_reads=None,
     skip_non_primary=True,
     duplex_deliminator=";",
+    cache_bam_index=False,
 ):
-    duplex_bam_index, _ = index_bam(
-        duplex_bam_path, skip_non_primary=skip_non_primary, req_tags=set()
+    index_func = cached_index_bam if cache_bam_index else index_bam
+    duplex_bam_index, _ = index_func(
+        duplex_bam_path,
+        skip_non_primary=skip_non_primary,
+        req_tags=set(),
+        num_workers=num_extract_alignment_threads,
     )
     duplex_bam_index = {
         k.split(duplex_deliminator)[0]: v for k, v in duplex_bam_index.items()
     }
 
-    simplex_bam_index, _ = index_bam(
-        simplex_bam_path, skip_non_primary=True, req_tags={"mv"}
+    simplex_bam_index, _ = index_func(
+        simplex_bam_path,
+        skip_non_primary=True,
+        req_tags={"mv"},
+        num_workers=num_extract_alignment_threads,
     )
     pairs = DuplexPairsBuilder.parse_pairs(pairs_path)
     valid_pairs, num_valid_reads = check_simplex_alignments(
@@ -493,33 +663,38 @@ def infer_duplex(
         num_reads = min(num_valid_reads, num_reads)
 
     # source of pipeline, template, complement read ID pairs
-    # produces template, complement read id tuples
+    # produces batches of template, complement read id tuples so pod5 reads
+    # are fetched with one selection per batch
     def iter_pairs(pairs, num_reads):
-        for i, pair in enumerate(pairs):
-            if num_reads is not None and i > num_reads - 1:
-                return
-            yield pair
+        if num_reads is not None:
+            pairs = pairs[:num_reads]
+        batch_size = constants.POD5_READ_BATCH_SIZE
+        for batch_start in range(0, len(pairs), batch_size):
+            yield pairs[batch_start : batch_start + batch_size]
 
     read_id_pairs = BackgroundIter(
         iter_pairs,
         kwargs=dict(pairs=valid_pairs, num_reads=num_reads),
+        q_maxsize=BATCH_QUEUE_SIZE,
         use_process=True,
     )
 
-    # consumes: tuple of template, complement read Ids
+    # consumes: list of tuples of template, complement read Ids
     # prep: open resources for Pod5 and simplex BAM
-    # produces: (io.Read, io.Read), str
+    # produces: list of ((io.Read, io.Read), str)
     io_read_pairs_results = MultitaskMap(
         iter_duplexed_io_reads,
         read_id_pairs,
         prep_func=prep_duplex_read_builder,
         args=(simplex_bam_index, simplex_pod5_path, simplex_bam_path),
+        q_maxsize=BATCH_QUEUE_SIZE,
         name="BuildDuplexedIoReads",
         num_workers=num_extract_alignment_threads,
         use_process=True,
     )
 
-    def make_duplex_reads(
+    @catch_read_errors
+    def make_duplex_read(
         read_pair_result: Tuple[Tuple[IoRead, IoRead], Any],
         duplex_index,
         bam_file_handle,
@@ -541,18 +716,26 @@ def infer_duplex(
 
             return duplex_read, None
 
-    # consumes: tuple of io.Reads (template, complement)
-    # produces: (DuplexRead, str), for inference by the model
+    def make_duplex_reads(read_pair_results, duplex_index, bam_file_handle):
+        return [
+            make_duplex_read(read_pair_result, duplex_index, bam_file_handle)
+            for read_pair_result in read_pair_results
+        ]
+
+    # consumes: list of tuples of io.Reads (template, complement)
+    # produces: list of (DuplexRead, str), for inference by the model
     duplex_aln = pysam.AlignmentFile(duplex_bam_path, "rb", check_sq=False)
     duplex_reads = MultitaskMap(
         make_duplex_reads,
         io_read_pairs_results,
         num_workers=num_duplex_prep_workers,
         args=(duplex_bam_index, duplex_aln),
+        q_maxsize=BATCH_QUEUE_SIZE,
         name="MakeDuplexReads",
         use_process=True,
     )
 
+    @catch_read_errors
     def add_mod_mappings_to_alignment(
         duplex_read_result: Tuple[DuplexRead, str],
         caller: DuplexReadModCaller,
@@ -568,24 +751,37 @@ def infer_duplex(
         record["tags"] = [
             tag
             for tag in record["tags"]
-            if not (tag.startswith("MM") or tag.startswith("ML"))
+            if not tag.startswith(_MOD_TAG_PREFIXES)
         ]
         record["tags"].extend(mod_tags)
         return record, None
 
+    def add_mod_mappings_to_alignments(duplex_read_results, caller):
+        return [
+            add_mod_mappings_to_alignment(duplex_read_result, caller)
+            for duplex_read_result in duplex_read_results
+        ]
+
     duplex_caller = DuplexReadModCaller(model, model_metadata)
     use_process = True
     if isinstance(model, RecursiveScriptModule):
-        use_process = next(model.parameters()).device.type == "cpu"
-
-    # consumes: Result[DuplexReads, str]
-    # produces: (dict, str) the dict is the BAM record with mods
+        device_type = next(model.parameters()).device.type
+        use_process = device_type == "cpu"
+        if device_type == "cuda":
+            # see infer_from_pod5_and_bam
+            torch.backends.cudnn.benchmark = True
+
+    # consumes: list of Result[DuplexReads, str]
+    # produces: list of (dict, str) the dict is the BAM record with mods
     # added/substituted mod tags
     alignment_records_with_mod_tags = MultitaskMap(
-        add_mod_mappings_to_alignment,
+        add_mod_mappings_to_alignments,
         duplex_reads,
+        prep_func=prep_cpu_infer_worker if use_process else None,
         num_workers=num_infer_threads,
         args=(duplex_caller,),
+        kwargs={"num_workers": num_infer_threads} if use_process else {},
+        q_maxsize=BATCH_QUEUE_SIZE,
         name="InferMods",
         use_process=use_process,
     )
@@ -593,18 +789,25 @@ def infer_duplex(
     errs = defaultdict(int)
     pysam_save = pysam.set_verbosity(0)
     with pysam.AlignmentFile(duplex_bam_path, "rb", check_sq=False) as in_bam:
-        with pysam.AlignmentFile(out_bam, "wb", template=in_bam) as out_bam:
-            for mod_read_mapping, err in tqdm(
-                alignment_records_with_mod_tags, total=num_reads
-            ):
-                if err is not None:
-                    errs[err] += 1
-                    continue
-                out_bam.write(
-                    pysam.AlignedSegment.from_dict(
-                        mod_read_mapping, out_bam.header
-                    )
-                )
+        with pysam.AlignmentFile(
+            out_bam,
+            "wb",
+            template=in_bam,
+            threads=constants.DEFAULT_BAM_WRITE_THREADS,
+        ) as out_bam:
+            out_header, write_aln = out_bam.header, out_bam.write
+            with tqdm(total=num_reads) as pbar:
+                for batch_results in alignment_records_with_mod_tags:
+                    for mod_read_mapping, err in batch_results:
+                        if err is not None:
+                            errs[err] += 1
+                            continue
+                        write_aln(
+                            pysam.AlignedSegment.from_dict(
+                                mod_read_mapping, out_header
+                            )
+                        )
+                    pbar.update(len(batch_results))
     pysam.set_verbosity(pysam_save)
     duplex_aln.close()
 
@@ -1,18 +1,26 @@
 import os
-from copy import copy
+import re
+import zlib
+import array
+import struct
+import hashlib
+import zipfile
 from pathlib import Path
+from functools import lru_cache
 from dataclasses import dataclass
-from collections import defaultdict
-from typing import Iterator, Optional, Tuple
+from collections.abc import Mapping
+from typing import Iterator, List, Optional, Tuple
 
 import pod5
 import pysam
 import numpy as np
+import pandas as pd
 from tqdm import tqdm
 from pysam import AlignedSegment
 
 from remora import log
 from remora import util
+from remora import constants
 from remora.constants import PA_TO_NORM_SCALING_FACTOR
 from remora import data_chunks as DC, duplex_utils as DU, RemoraError
 
@@ -21,43 +29,148 @@ LOGGER = log.get_logger()
 # Note sm and sd tags are not required, but highly recommended to pass
 # basecaller scaling into remora
 REQUIRED_TAGS = {"mv"}
+# BED fields read by remora (through strand); further fields are ignored
+BED_NUM_USED_FIELDS = 6
+# BGZF block header (gzip magic with extra "BC" subfield holding block size)
+BGZF_MAGIC = b"\x1f\x8b\x08\x04"
+BGZF_HEADER_SIZE = 18
+BGZF_MAX_BLOCK_SIZE = 2**16
+# number of consecutive BGZF block headers checked to locate a block start
+BGZF_CHECK_BLOCKS = 4
+# fixed length fields at the start of a BAM record (before the read name)
+BAM_RECORD_HEADER = struct.Struct("<iiiBBHHHiiii")
+BAM_READ_NAME_PATTERN = re.compile(rb"[!-?A-~]+")
+# number of BGZF blocks searched for the first record when indexing a shard
+BAM_SHARD_SEARCH_BLOCKS = 16
+# minimum compressed size of each shard when indexing BAM files in parallel
+MIN_BAM_INDEX_SHARD_SIZE = 2**26
+# version of the saved BAM index format written by cached_index_bam
+BAM_INDEX_CACHE_VERSION = 1
+# reference sequence is cached from FASTA files in windows of this size
+REF_CACHE_WINDOW_SIZE = 1_000_000
+REF_CACHE_NUM_WINDOWS = 16
+# keys of the mandatory SAM fields as returned by pysam.AlignedSegment.to_dict
+SAM_DICT_KEYS = (
+    "name",
+    "flag",
+    "ref_name",
+    "ref_pos",
+    "map_quality",
+    "cigar",
+    "next_ref_name",
+    "next_ref_pos",
+    "length",
+    "seq",
+    "qual",
+)
+
+
+def _read_bed_intervals(bed_path):
+    """Read intervals from a BED file grouped by contig and strand. Intervals
+    without a valid strand are added to both strands.
+
+    Returns:
+        Dictionary with (contig, strand) keys and 3-tuple values containing
+        start, end and name arrays for the intervals in file order.
+    """
+    with open(bed_path) as bed_fh:
+        lines = pd.Series(bed_fh.read().splitlines(), dtype=object)
+    # split only the used fields so rows may have any number of fields
+    # (e.g. 3 field BED or 18 field bedMethyl)
+    bed = (
+        lines[lines.str.strip() != ""]
+        .str.split(n=BED_NUM_USED_FIELDS, expand=True)
+        .reindex(columns=range(BED_NUM_USED_FIELDS))
+    )
+    bed = bed[[0, 1, 2, 3, 5]].astype({1: np.int64, 2: np.int64})
+    stranded = bed[5].isin(("+", "-"))
+    strand_beds = [bed[stranded]]
+    for strand in "+-":
+        strand_bed = bed[~stranded].copy()
+        strand_bed[5] = strand
+        strand_beds.append(strand_bed)
+    # restore file order so later intervals take precedence
+    bed = pd.concat(strand_beds).sort_index(kind="stable")
+    return dict(
+        (
+            cs,
+            (
+                cs_bed[1].to_numpy(),
+                cs_bed[2].to_numpy(),
+                cs_bed[3].to_numpy(dtype=str),
+            ),
+        )
+        for cs, cs_bed in bed.groupby([0, 5], sort=False)
+    )
 
-_SIG_PROF_FN = os.getenv("REMORA_EXTRACT_SIGNAL_PROFILE_FILE")
-_ALIGN_PROF_FN = os.getenv("REMORA_EXTRACT_ALIGN_PROFILE_FILE")
+
+def _expand_intervals(starts, ends):
+    """Expand intervals into the positions they cover, in interval order.
+
+    Returns:
+        2-tuple containing covered positions and number of positions covered
+        by each interval
+    """
+    lens = np.maximum(ends - starts, 0)
+    offsets = np.cumsum(lens) - lens
+    poss = np.repeat(starts - offsets, lens) + np.arange(lens.sum())
+    return poss, lens
 
 
 def parse_bed(bed_path):
-    regs = defaultdict(set)
-    with open(bed_path) as regs_fh:
-        for line in regs_fh:
-            fields = line.split()
-            ctg, st, en = fields[:3]
-            if len(fields) < 6 or fields[5] not in "+-":
-                for strand in "+-":
-                    regs[(ctg, strand)].update(range(int(st), int(en)))
-            else:
-                regs[(ctg, fields[5])].update(range(int(st), int(en)))
+    """Parse positions covered by a BED file.
+
+    Returns:
+        Dictionary with (contig, strand) keys and sorted arrays of unique
+        covered positions as values. Contigs and strands covering no
+        positions (only zero-length intervals) are not included.
+    """
+    regs = {}
+    for cs, (sts, ens, _) in _read_bed_intervals(bed_path).items():
+        poss = np.unique(_expand_intervals(sts, ens)[0])
+        if poss.size > 0:
+            regs[cs] = poss
     return regs
 
 
 def parse_mods_bed(bed_path):
-    regs = defaultdict(dict)
+    """Parse ground truth modified bases from a BED file with the modified
+    base single letter code in the name field. If a position is covered by
+    more than one interval, the last interval in the file is used.
+
+    Returns:
+        2-tuple containing:
+          1. Dictionary with (contig, strand) keys and 2-tuple values
+            containing sorted unique positions and modified base at each
+            position. Contigs and strands covering no positions are not
+            included.
+          2. Set of all modified bases
+    """
+    regs = {}
     all_mods = set()
-    with open(bed_path) as regs_fh:
-        for line in regs_fh:
-            fields = line.split()
-            ctg, st, en, mod = fields[:4]
+    for cs, (sts, ens, mods) in _read_bed_intervals(bed_path).items():
+        for mod in np.unique(mods):
             all_mods.update(mod)
-            if len(fields) < 6 or fields[5] not in "+-":
-                for strand in "+-":
-                    for pos in range(int(st), int(en)):
-                        regs[(ctg, strand)][pos] = mod
-            else:
-                for pos in range(int(st), int(en)):
-                    regs[(ctg, fields[5])][pos] = mod
+        poss, lens = _expand_intervals(sts, ens)
+        if poss.size == 0:
+            continue
+        # reverse so np.unique selects the last occurrence of each position
+        poss, pos_mods = poss[::-1], np.repeat(mods, lens)[::-1]
+        poss, last_idx = np.unique(poss, return_index=True)
+        regs[cs] = (poss, pos_mods[last_idx])
     return regs, all_mods
 
 
+def has_tags(read, tags):
+    """Check that read (pysam.AlignedSegment) has all tags without building
+    a set or generator per read.
+    """
+    for tag in tags:
+        if not read.has_tag(tag):
+            return False
+    return True
+
+
 def read_is_primary(read):
     """
     :param read: pysam.AlignedSegment
@@ -66,49 +179,534 @@ def read_is_primary(read):
     return not (read.is_supplementary or read.is_secondary)
 
 
+class BamIndex(Mapping):
+    """Mapping from read ID to the virtual file offsets of the BAM records
+    for that read, in file order. Offsets for all reads are stored in a
+    single int64 array grouped by read so that indexing large BAM files does
+    not create a Python list and int objects for every record.
+
+    Args:
+        read_nums (dict): Read ID to read number
+        read_starts (np.ndarray): Start of each read number within offsets,
+            with a final value equal to the number of offsets
+        offsets (np.ndarray): Virtual file offsets grouped by read number
+    """
+
+    def __init__(self, read_nums, read_starts, offsets):
+        self.read_nums = read_nums
+        self.read_starts = read_starts
+        self.offsets = offsets
+
+    @classmethod
+    def from_records(cls, read_nums, rec_read_nums, rec_offsets):
+        """Group record offsets by read number (maintaining file order)
+
+        Args:
+            read_nums (dict): Read ID to read number
+            rec_read_nums (np.ndarray): Read number for each record
+            rec_offsets (np.ndarray): Virtual file offset for each record
+        """
+        read_starts = np.zeros(len(read_nums) + 1, dtype=np.int64)
+        np.cumsum(
+            np.bincount(rec_read_nums, minlength=len(read_nums)),
+            out=read_starts[1:],
+        )
+        offsets = rec_offsets[np.argsort(rec_read_nums, kind="stable")]
+        return cls(read_nums, read_starts, offsets)
+
+    def __getitem__(self, read_id):
+        read_num = self.read_nums[read_id]
+        return self.offsets[
+            self.read_starts[read_num] : self.read_starts[read_num + 1]
+        ].tolist()
+
+    def __contains__(self, read_id):
+        return read_id in self.read_nums
+
+    def __iter__(self):
+        return iter(self.read_nums)
+
+    def __len__(self):
+        return len(self.read_nums)
+
+
+def _bgzf_block_size(data, pos):
+    """Total size of the BGZF block starting at pos within data, or None if
+    there is no valid BGZF block header at pos.
+    """
+    if (
+        len(data) < pos + BGZF_HEADER_SIZE
+        or data[pos : pos + len(BGZF_MAGIC)] != BGZF_MAGIC
+    ):
+        return None
+    xlen, si1, si2, slen, bsize = struct.unpack_from("<HBBHH", data, pos + 10)
+    if xlen != 6 or si1 != ord("B") or si2 != ord("C") or slen != 2:
+        return None
+    return bsize + 1
+
+
+def _find_bgzf_block(raw_fh, start):
+    """Find the address of the first BGZF block starting at or after start.
+    Candidate block headers are accepted when followed by a chain of valid
+    block headers.
+    """
+    raw_fh.seek(start)
+    data = raw_fh.read(BGZF_MAX_BLOCK_SIZE * (BGZF_CHECK_BLOCKS + 1))
+    pos = data.find(BGZF_MAGIC)
+    while pos != -1:
+        block_pos = pos
+        for _ in range(BGZF_CHECK_BLOCKS):
+            block_size = _bgzf_block_size(data, block_pos)
+            if block_size is None:
+                break
+            block_pos += block_size
+            if block_pos >= len(data):
+                return start + pos
+        else:
+            return start + pos
+        pos = data.find(BGZF_MAGIC, pos + 1)
+    return None
+
+
+def _is_bam_record_chain(buf, pos, num_refs):
+    """Check that a chain of plausible BAM records starts at pos and covers
+    the rest of buf (the last record may be truncated).
+    """
+    num_recs = 0
+    while pos + BAM_RECORD_HEADER.size <= len(buf):
+        (
+            block_size,
+            ref_id,
+            ref_pos,
+            name_len,
+            _,
+            _,
+            num_cigar_ops,
+            _,
+            seq_len,
+            next_ref_id,
+            next_pos,
+            _,
+        ) = BAM_RECORD_HEADER.unpack_from(buf, pos)
+        if not (
+            -1 <= ref_id < num_refs
+            and -1 <= next_ref_id < num_refs
+            and ref_pos >= -1
+            and next_pos >= -1
+            and name_len >= 2
+            and seq_len >= 0
+            and block_size
+            >= 32 + name_len + 4 * num_cigar_ops + (seq_len + 1) // 2 + seq_len
+        ):
+            return False
+        name_start = pos + BAM_RECORD_HEADER.size
+        name_end = name_start + name_len - 1
+        if name_end < len(buf) and (
+            buf[name_end] != 0
+            or BAM_READ_NAME_PATTERN.fullmatch(buf, name_start, name_end)
+            is None
+        ):
+            return False
+        num_recs += 1
+        pos += 4 + block_size
+    return num_recs > 0
+
+
+def _find_first_bam_record(bam_path, block_start, num_refs):
+    """Find the virtual offset of the first BAM record starting at or after
+    the BGZF block at block_start. BAM records are not aligned to BGZF blocks,
+    so the first position in the decompressed data starting a chain of
+    plausible records is selected.
+
+    Returns:
+        Virtual file offset or None if no record start was found
+    """
+    with open(bam_path, "rb") as raw_fh:
+        raw_fh.seek(block_start)
+        raw = raw_fh.read(BGZF_MAX_BLOCK_SIZE * BAM_SHARD_SEARCH_BLOCKS)
+    block_addrs, data_starts, blocks_data = [], [], []
+    pos = data_len = 0
+    while len(block_addrs) < BAM_SHARD_SEARCH_BLOCKS:
+        block_size = _bgzf_block_size(raw, pos)
+        if block_size is None or pos + block_size > len(raw):
+            break
+        data = zlib.decompress(
+            raw[pos + BGZF_HEADER_SIZE : pos + block_size - 8], wbits=-15
+        )
+        block_addrs.append(block_start + pos)
+        data_starts.append(data_len)
+        blocks_data.append(data)
+        data_len += len(data)
+        pos += block_size
+    buf = b"".join(blocks_data)
+    arr = np.frombuffer(buf, dtype=np.uint8)
+    # quickly filter candidates for a read name null terminated at the
+    # position given by the read name length
+    cands = np.arange(max(0, arr.size - BAM_RECORD_HEADER.size))
+    name_ends = cands + BAM_RECORD_HEADER.size + arr[cands + 12] - 1
+    valid_cands = (arr[cands + 12] >= 2) & (name_ends < arr.size)
+    valid_cands[valid_cands] = arr[name_ends[valid_cands]] == 0
+    for cand in np.flatnonzero(valid_cands):
+        if _is_bam_record_chain(buf, cand, num_refs):
+            block_idx = np.searchsorted(data_starts, cand, side="right") - 1
+            return (block_addrs[block_idx] << 16) | int(
+                cand - data_starts[block_idx]
+            )
+    return None
+
+
+def _index_bam_records(
+    bam_fh, skip_non_primary, req_tags, careful, end_block=None, pbar=None
+):
+    """Collect read names and virtual offsets of BAM records from the current
+    position of bam_fh up to the first record starting in or after the BGZF
+    block at end_block.
+
+    Returns:
+        3-tuple containing read names, virtual offsets and virtual offset
+        where the scan stopped
+    """
+    read_ids = []
+    offsets = array.array("q")
+    while True:
+        read_ptr = bam_fh.tell()
+        if end_block is not None and read_ptr >> 16 >= end_block:
+            break
+        try:
+            read = next(bam_fh)
+        except StopIteration:
+            break
+        if not has_tags(read, req_tags):
+            if careful:
+                raise RemoraError("missing tags")
+            continue
+        if skip_non_primary and not read_is_primary(read):
+            continue
+        read_ids.append(read.query_name)
+        offsets.append(read_ptr)
+        if pbar is not None:
+            pbar.update()
+    return read_ids, offsets, read_ptr
+
+
+def _index_bam_shard(shard, bam_path, skip_non_primary, req_tags, careful):
+    shard_idx, start_block, end_block = shard
+    pysam_save = pysam.set_verbosity(0)
+    try:
+        with pysam.AlignmentFile(bam_path, mode="rb", check_sq=False) as bam_fh:
+            start = _find_first_bam_record(
+                bam_path, start_block, bam_fh.nreferences
+            )
+            if start is None:
+                return shard_idx, None
+            bam_fh.seek(start)
+            shard_records = _index_bam_records(
+                bam_fh,
+                skip_non_primary,
+                req_tags,
+                careful,
+                end_block=end_block,
+            )
+    finally:
+        pysam.set_verbosity(pysam_save)
+    return shard_idx, (start, *shard_records)
+
+
+def _index_bam_shard_blocks(bam_path, num_shards):
+    """Split BAM file into at most num_shards shards of at least
+    MIN_BAM_INDEX_SHARD_SIZE compressed bytes.
+
+    Returns:
+        BGZF block addresses starting each shard after the first
+    """
+    file_size = os.path.getsize(bam_path)
+    num_shards = min(num_shards, file_size // MIN_BAM_INDEX_SHARD_SIZE)
+    shard_blocks = []
+    with open(bam_path, "rb") as raw_fh:
+        for shard_idx in range(1, num_shards):
+            block = _find_bgzf_block(
+                raw_fh, file_size * shard_idx // num_shards
+            )
+            if block is not None and (
+                len(shard_blocks) == 0 or block > shard_blocks[-1]
+            ):
+                shard_blocks.append(block)
+    return shard_blocks
+
+
 def index_bam(
-    bam_path, skip_non_primary, req_tags=REQUIRED_TAGS, careful=False
-) -> (dict, int):
-    bam_idx = {} if skip_non_primary else defaultdict(list)
-    num_reads = 0
+    bam_path,
+    skip_non_primary,
+    req_tags=REQUIRED_TAGS,
+    careful=False,
+    num_workers=1,
+) -> (BamIndex, int):
+    """Index BAM records by read id.
+
+    Large BAM files are split into shards at BGZF block boundaries and shards
+    after the first are indexed in num_workers - 1 worker processes. Each
+    worker locates the first record in its shard. Shards are checked to
+    start exactly where the previous shard stopped and any shard which does
+    not is re-indexed from that position, so the index matches a sequential
+    scan of the file.
+    """
     # hid warnings for no index when using unmapped or unsorted files
     pysam_save = pysam.set_verbosity(0)
-    with pysam.AlignmentFile(bam_path, mode="rb", check_sq=False) as bam_fh:
+    with pysam.AlignmentFile(
+        bam_path,
+        mode="rb",
+        check_sq=False,
+        threads=constants.DEFAULT_BAM_READ_THREADS,
+    ) as bam_fh:
         pbar = tqdm(
             smoothing=0,
             unit=" Reads",
             desc="Indexing BAM by read id",
         )
-        while True:
-            read_ptr = bam_fh.tell()
-            try:
-                read = next(bam_fh)
-            except StopIteration:
-                break
-            tags = set(tg[0] for tg in read.tags)
-            if len(req_tags.intersection(tags)) != len(req_tags):
-                if careful:
-                    raise RemoraError("missing tags")
-                continue
-            if skip_non_primary:
-                if not read_is_primary(read) or read.query_name in bam_idx:
-                    continue
-                bam_idx[read.query_name] = [read_ptr]
-            else:
-                bam_idx[read.query_name].append(read_ptr)
-            num_reads += 1
-            pbar.update()
+        shard_blocks = _index_bam_shard_blocks(bam_path, num_workers)
+        if len(shard_blocks) > 0:
+            shard_results = util.MultitaskMap(
+                _index_bam_shard,
+                [
+                    (shard_idx, start_block, end_block)
+                    for shard_idx, (start_block, end_block) in enumerate(
+                        zip(shard_blocks, shard_blocks[1:] + [None]), 1
+                    )
+                ],
+                num_workers=len(shard_blocks),
+                args=(bam_path, skip_non_primary, req_tags, careful),
+                name="IndexBAM",
+                use_process=True,
+            )
+        end_blocks = shard_blocks + [None]
+        read_ids, offsets, stop = _index_bam_records(
+            bam_fh,
+            skip_non_primary,
+            req_tags,
+            careful,
+            end_block=end_blocks[0],
+            pbar=pbar,
+        )
+        shards_records = [(read_ids, offsets)]
+        if len(shard_blocks) > 0:
+            shard_results = dict(shard_results)
+            for shard_idx, end_block in enumerate(end_blocks[1:], 1):
+                shard_result = shard_results.get(shard_idx)
+                if shard_result is not None and shard_result[0] == stop:
+                    _, read_ids, offsets, stop = shard_result
+                    pbar.update(len(read_ids))
+                else:
+                    LOGGER.debug(f"Re-indexing BAM shard {shard_idx}")
+                    bam_fh.seek(stop)
+                    read_ids, offsets, stop = _index_bam_records(
+                        bam_fh,
+                        skip_non_primary,
+                        req_tags,
+                        careful,
+                        end_block=end_block,
+                        pbar=pbar,
+                    )
+                shards_records.append((read_ids, offsets))
     pysam.set_verbosity(pysam_save)
-    return dict(bam_idx), num_reads
+    # number reads in order of first record
+    rec_read_nums, read_ids = pd.factorize(
+        np.array(
+            [read_id for read_ids, _ in shards_records for read_id in read_ids],
+            dtype=object,
+        )
+    )
+    rec_offsets = np.concatenate(
+        [
+            np.frombuffer(offsets, dtype=np.int64)
+            for _, offsets in shards_records
+        ]
+    )
+    if skip_non_primary:
+        # keep first record for reads with multiple primary records
+        first_recs = np.unique(rec_read_nums, return_index=True)[1]
+        rec_read_nums = rec_read_nums[first_recs]
+        rec_offsets = rec_offsets[first_recs]
+    read_nums = dict(zip(read_ids.tolist(), range(read_ids.size)))
+    bam_idx = BamIndex.from_records(read_nums, rec_read_nums, rec_offsets)
+    return bam_idx, rec_offsets.size
+
+
+def _load_bam_index_cache(idx_path, idx_key):
+    """Load BAM index saved by _save_bam_index_cache. Returns None if the
+    saved index was written for a different BAM file, BAM file state, index
+    arguments or index format version.
+    """
+    # allow_pickle=False so a saved index can never execute code
+    with np.load(idx_path, allow_pickle=False) as idx_data:
+        saved_key = (
+            int(idx_data["version"]),
+            str(idx_data["bam_path"]),
+            int(idx_data["bam_size"]),
+            int(idx_data["bam_mtime_ns"]),
+            str(idx_data["idx_args"]),
+        )
+        if saved_key != idx_key:
+            return None
+        read_ids = idx_data["read_ids"].tolist()
+        bam_idx = BamIndex(
+            dict(zip(read_ids, range(len(read_ids)))),
+            idx_data["read_starts"],
+            idx_data["offsets"],
+        )
+        return bam_idx, int(idx_data["num_reads"])
+
+
+def _save_bam_index_cache(idx_path, idx_key, bam_idx, num_reads):
+    """Save BAM index arrays along with the key identifying the BAM file
+    state and index arguments. The index is written to a temporary file and
+    moved into place so readers never see a partially written index.
+    """
+    version, bam_path, bam_size, bam_mtime_ns, idx_args = idx_key
+    read_ids = np.empty(len(bam_idx.read_nums), dtype=object)
+    read_ids[list(bam_idx.read_nums.values())] = list(bam_idx.read_nums)
+    tmp_path = f"{idx_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as idx_fh:
+            np.savez(
+                idx_fh,
+                version=version,
+                bam_path=bam_path,
+                bam_size=bam_size,
+                bam_mtime_ns=bam_mtime_ns,
+                idx_args=idx_args,
+                read_ids=read_ids.astype(str),
+                read_starts=bam_idx.read_starts,
+                offsets=bam_idx.offsets,
+                num_reads=num_reads,
+            )
+        os.replace(tmp_path, idx_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def cached_index_bam(
+    bam_path,
+    skip_non_primary,
+    req_tags=REQUIRED_TAGS,
+    careful=False,
+    num_workers=1,
+) -> (BamIndex, int):
+    """Index BAM file as in index_bam, saving the index next to the BAM file.
+    The saved index is reused by later calls while the BAM file path, size
+    and modification time, the index arguments and the index format version
+    are unchanged.
+    """
+    bam_stat = os.stat(bam_path)
+    idx_args = repr((tuple(sorted(req_tags)), skip_non_primary, careful))
+    idx_key = (
+        BAM_INDEX_CACHE_VERSION,
+        os.path.abspath(bam_path),
+        bam_stat.st_size,
+        bam_stat.st_mtime_ns,
+        idx_args,
+    )
+    args_hash = hashlib.md5(idx_args.encode()).hexdigest()[:8]
+    idx_path = f"{bam_path}.{args_hash}.remora_idx.npz"
+    try:
+        loaded_idx = _load_bam_index_cache(idx_path, idx_key)
+        if loaded_idx is not None:
+            LOGGER.info(f"Loaded BAM index from {idx_path}")
+            return loaded_idx
+        LOGGER.debug(f"Saved BAM index {idx_path} is out of date")
+    except FileNotFoundError:
+        pass
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile) as e:
+        LOGGER.debug(f"Could not load BAM index {idx_path}: {e}")
+    bam_idx, num_reads = index_bam(
+        bam_path,
+        skip_non_primary,
+        req_tags=req_tags,
+        careful=careful,
+        num_workers=num_workers,
+    )
+    try:
+        _save_bam_index_cache(idx_path, idx_key, bam_idx, num_reads)
+    except OSError as e:
+        LOGGER.warning(f"Could not save BAM index to {idx_path}: {e}")
+    return bam_idx, num_reads
+
+
+class ReferenceCache:
+    """Fetch reference sequence from an indexed FASTA file, keeping recently
+    used windows of the reference in memory.
+
+    Args:
+        fasta_path (str): Path to indexed FASTA file
+        window_size (int): Length of cached reference windows
+        num_windows (int): Maximum number of windows to cache
+    """
+
+    def __init__(
+        self,
+        fasta_path,
+        window_size=REF_CACHE_WINDOW_SIZE,
+        num_windows=REF_CACHE_NUM_WINDOWS,
+    ):
+        self.fasta = pysam.FastaFile(fasta_path)
+        self.window_size = window_size
+        self._get_window = lru_cache(maxsize=num_windows)(self._fetch_window)
+
+    def _fetch_window(self, ctg, window_idx):
+        window_start = window_idx * self.window_size
+        return self.fasta.fetch(
+            ctg, window_start, window_start + self.window_size
+        ).upper()
+
+    def fetch(self, ctg, start, end):
+        """Upper case reference sequence for contig from start to end"""
+        first_window = start // self.window_size
+        last_window = max(first_window, (end - 1) // self.window_size)
+        seq = "".join(
+            self._get_window(ctg, window_idx)
+            for window_idx in range(first_window, last_window + 1)
+        )
+        seq_start = start - first_window * self.window_size
+        return seq[seq_start : seq_start + end - start]
+
+    def get_reference_sequence(self, alignment_record):
+        """Upper case reference sequence covered by alignment_record. Replaces
+        pysam.AlignedSegment.get_reference_sequence without parsing the MD
+        tag.
+        """
+        return self.fetch(
+            alignment_record.reference_name,
+            alignment_record.reference_start,
+            alignment_record.reference_end,
+        )
 
 
 @dataclass
 class RefPos:
+    __slots__ = ("ctg", "strand", "start")
     ctg: str
     strand: str
     start: int
 
 
+def sam_str_to_dict(sam_str):
+    """Convert a SAM record string into a dict as returned by
+    pysam.AlignedSegment.to_dict
+
+    Args:
+        sam_str (str): SAM record as returned by
+            pysam.AlignedSegment.to_string
+
+    Returns:
+        Dict with SAM_DICT_KEYS fields and list of tag strings under "tags"
+    """
+    fields = sam_str.split("\t")
+    sam_dict = dict(zip(SAM_DICT_KEYS, fields))
+    sam_dict["tags"] = fields[len(SAM_DICT_KEYS) :]
+    return sam_dict
+
+
+@util.add_slots
 @dataclass
 class Read:
     read_id: str
@@ -128,7 +726,16 @@ class Read:
     ref_pos: RefPos = None
     cigar: list = None
     ref_to_signal: np.ndarray = None
-    full_align: str = None
+    full_align_str: str = None
+
+    def copy(self):
+        """Shallow copy of this read. Copying the slots directly avoids the
+        generic copy.copy reduce protocol.
+        """
+        read = Read.__new__(Read)
+        for name in Read.__slots__:
+            setattr(read, name, getattr(self, name))
+        return read
 
     @staticmethod
     def convert_signal_to_pA(
@@ -146,16 +753,57 @@ class Read:
         )
         return shift_pa_to_norm, scale_pa_to_norm
 
+    @staticmethod
+    def compute_pa_to_norm_scaling_from_dacs(
+        signal: np.ndarray,
+        *,
+        scale_dacs_to_pa: float,
+        offset_dacs_to_pa: float,
+        factor: float = PA_TO_NORM_SCALING_FACTOR,
+    ) -> (float, float):
+        """Compute the same values as compute_pa_to_norm_scaling without
+        converting the full signal to pA. The median and median absolute
+        deviation are computed on the raw signal and then converted, as both
+        are equivariant under the DAC to pA conversion (positive scale).
+        """
+        # single float32 copy (exact for int16 DAC values) reused in place
+        signal = signal.astype(np.float32)
+        med_dacs = float(np.median(signal, overwrite_input=True))
+        np.abs(np.subtract(signal, med_dacs, out=signal), out=signal)
+        mad_dacs = float(np.median(signal, overwrite_input=True))
+        shift_pa_to_norm = scale_dacs_to_pa * (med_dacs + offset_dacs_to_pa)
+        scale_pa_to_norm = max(1.0, scale_dacs_to_pa * mad_dacs * factor)
+        return shift_pa_to_norm, scale_pa_to_norm
+
+    @staticmethod
+    def compute_dacs_to_norm_scaling(
+        shift_pa_to_norm: float,
+        scale_pa_to_norm: float,
+        *,
+        scale_dacs_to_pa: float,
+        offset_dacs_to_pa: float,
+    ) -> (float, float):
+        """Compose the DAC to pA and pA to norm conversions into a single
+        DAC to norm shift and scale.
+        """
+        inv_scale_dacs_to_pa = 1.0 / scale_dacs_to_pa
+        shift_dacs_to_norm = (
+            shift_pa_to_norm * inv_scale_dacs_to_pa
+        ) - offset_dacs_to_pa
+        scale_dacs_to_norm = scale_pa_to_norm * inv_scale_dacs_to_pa
+        return shift_dacs_to_norm, scale_dacs_to_norm
+
     def set_pa_to_norm_scaling(self, factor=PA_TO_NORM_SCALING_FACTOR):
         assert self.scale_dacs_to_pa is not None
         assert self.shift_dacs_to_pa is not None
-        pa_signal = Read.convert_signal_to_pA(
+        (
+            shift_pa_to_norm,
+            scale_pa_to_norm,
+        ) = Read.compute_pa_to_norm_scaling_from_dacs(
             self.signal,
             scale_dacs_to_pa=self.scale_dacs_to_pa,
             offset_dacs_to_pa=self.shift_dacs_to_pa,
-        )
-        shift_pa_to_norm, scale_pa_to_norm = Read.compute_pa_to_norm_scaling(
-            pa_signal, factor=factor
+            factor=factor,
         )
         self.shift_pa_to_norm = shift_pa_to_norm
         self.scale_pa_to_norm = scale_pa_to_norm
@@ -173,7 +821,7 @@ class Read:
             len(duplex_read_alignment.query_sequence) > 0
         ), "duplex base call sequence is empty string?"
 
-        read = copy(self)
+        read = self.copy()
 
         duplex_read_sequence = (
             duplex_read_alignment.query_sequence
@@ -205,19 +853,23 @@ class Read:
 
     @staticmethod
     def _unpack_reference_alignment(
-        alignment_record: AlignedSegment, query_to_signal: np.ndarray
+        alignment_record: AlignedSegment,
+        query_to_signal: np.ndarray,
+        ref_cache: ReferenceCache = None,
     ):
-        ref_seq = alignment_record.get_reference_sequence()
+        if ref_cache is None:
+            ref_seq = alignment_record.get_reference_sequence().upper()
+        else:
+            ref_seq = ref_cache.get_reference_sequence(alignment_record)
         reverse_mapped = alignment_record.is_reverse
-        ref_seq = ref_seq.upper()
         if reverse_mapped:
             ref_seq = util.revcomp(ref_seq)
 
-        cigar = (
-            alignment_record.cigartuples[::-1]
-            if reverse_mapped
-            else alignment_record.cigartuples
-        )
+        # pysam builds a new cigartuples list on each access, so reverse it
+        # in place
+        cigar = alignment_record.cigartuples
+        if reverse_mapped:
+            cigar.reverse()
         ref_to_signal = DC.compute_ref_to_signal(
             query_to_signal=query_to_signal,
             cigar=cigar,
@@ -247,12 +899,16 @@ class Read:
         }
 
     @classmethod
-    def from_pod5_and_alignment(cls, pod5_read_record, alignment_record):
+    def from_pod5_and_alignment(
+        cls, pod5_read_record, alignment_record, ref_cache=None
+    ):
         """Initialize read from pod5 and pysam records
 
         Args:
             pod5_read_record (pod5.ReadRecord)
             alignment_record (pysam.AlignedSegment)
+            ref_cache (ReferenceCache): Fetch reference sequence from FASTA
+                instead of reconstructing it from the MD tag
         """
         try:
             alignment_record.get_tag("mv")
@@ -268,12 +924,10 @@ class Read:
             num_trimmed = 0
             signal = pod5_read_record.signal
 
-        mv_tag_value = alignment_record.get_tag("mv")
-        stride = mv_tag_value[0]
-        mv_table = np.array(mv_tag_value[1:])
-
-        query_to_signal = np.nonzero(mv_table)[0] * stride
-        query_to_signal = np.r_[query_to_signal, signal.shape[0]]
+        stride, mv_table = decode_move_tag(alignment_record.get_tag("mv"))
+        query_to_signal = moves_to_query_to_signal(
+            mv_table, stride, signal.shape[0]
+        )
 
         if mv_table.shape[0] != signal.shape[0] // stride:
             raise RemoraError("move table is discordant with signal")
@@ -292,18 +946,27 @@ class Read:
             (
                 shift_pa_to_norm,
                 scale_pa_to_norm,
-            ) = Read.compute_pa_to_norm_scaling(pod5_read_record.signal_pa)
+            ) = Read.compute_pa_to_norm_scaling_from_dacs(
+                pod5_read_record.signal,
+                scale_dacs_to_pa=pod5_read_record.calibration.scale,
+                offset_dacs_to_pa=pod5_read_record.calibration.offset,
+            )
 
-        shift_dacs_to_norm = (
-            shift_pa_to_norm / pod5_read_record.calibration.scale
-        ) - pod5_read_record.calibration.offset
-        scale_dacs_to_norm = (
-            scale_pa_to_norm / pod5_read_record.calibration.scale
+        (
+            shift_dacs_to_norm,
+            scale_dacs_to_norm,
+        ) = Read.compute_dacs_to_norm_scaling(
+            shift_pa_to_norm,
+            scale_pa_to_norm,
+            scale_dacs_to_pa=pod5_read_record.calibration.scale,
+            offset_dacs_to_pa=pod5_read_record.calibration.offset,
         )
 
         if alignment_record.reference_name is not None:
             properties = Read._unpack_reference_alignment(
-                alignment_record, query_to_signal=query_to_signal
+                alignment_record,
+                query_to_signal=query_to_signal,
+                ref_cache=ref_cache,
             )
         else:
             assert (
@@ -325,12 +988,12 @@ class Read:
             mv_table=mv_table,
             query_to_signal=query_to_signal,
             shift_dacs_to_pa=pod5_read_record.calibration.offset,
-            scale_dacs_to_pa=pod5_read_record.calibration.offset,
+            scale_dacs_to_pa=pod5_read_record.calibration.scale,
             shift_pa_to_norm=shift_pa_to_norm,
             scale_pa_to_norm=scale_pa_to_norm,
             shift_dacs_to_norm=shift_dacs_to_norm,
             scale_dacs_to_norm=scale_dacs_to_norm,
-            full_align=alignment_record.to_dict(),
+            full_align_str=alignment_record.to_string(),
             **properties,
         )
 
@@ -375,7 +1038,8 @@ class Read:
         """
         Args:
             select_focus_positions (dict): lookup table of (contig, strand)
-            tuples (both strings) to a set of positions to include.
+            tuples (both strings) to a sorted array of positions to include
+            (see parse_bed).
 
         Returns:
             np.ndarray of positions covered by the read and within the
@@ -391,14 +1055,10 @@ class Read:
             # no focus positions on contig/strand
             return np.array([], dtype=int)
 
-        read_focus_ref_pos = np.array(
-            sorted(
-                set(range(ref_pos.start, ref_pos.start + ref_len)).intersection(
-                    cs_focus_pos
-                )
-            ),
-            dtype=int,
+        read_st, read_en = np.searchsorted(
+            cs_focus_pos, (ref_pos.start, ref_pos.start + ref_len)
         )
+        read_focus_ref_pos = cs_focus_pos[read_st:read_en]
         return (
             read_focus_ref_pos - ref_pos.start
             if ref_pos.strand == "+"
@@ -441,6 +1101,15 @@ class Read:
 
 @dataclass
 class DuplexRead:
+    __slots__ = (
+        "duplex_read_id",
+        "duplex_alignment",
+        "is_reverse_mapped",
+        "template_read",
+        "complement_read",
+        "template_ref_start",
+        "complement_ref_start",
+    )
     duplex_read_id: str
     duplex_alignment: dict
     is_reverse_mapped: bool
@@ -519,6 +1188,7 @@ def iter_pod5_reads(
     LOGGER.debug("Completed pod5 signal worker")
 
 
+@util.maybe_profile("REMORA_EXTRACT_SIGNAL_PROFILE_FILE")
 def iter_signal(pod5_path, num_reads=None, read_ids=None):
     for pod5_read in iter_pod5_reads(
         pod5_path=pod5_path, num_reads=num_reads, read_ids=read_ids
@@ -548,9 +1218,17 @@ class DuplexPairsBuilder:
 
     @staticmethod
     def parse_pairs(pairs_path):
-        with open(pairs_path, "r") as fh:
-            pairs = [tuple(line.split()) for line in fh]
-        return pairs
+        try:
+            pairs_df = pd.read_csv(
+                pairs_path,
+                sep=r"\s+",
+                header=None,
+                usecols=[0, 1],
+                dtype=str,
+            )
+        except pd.errors.EmptyDataError:
+            return []
+        return list(zip(pairs_df[0], pairs_df[1]))
 
     def _make_read(self, p5_read) -> Optional[Read]:
         """Initialize io.Read from pod5 read object
@@ -577,39 +1255,68 @@ class DuplexPairsBuilder:
         )
         return io_read
 
-    def make_read_pair(self, read_id_pair: Tuple[str, str]):
-        try:
-            pod5_reads = self.reader.reads(
-                selection=list(read_id_pair), preload=["samples"]
-            )
-        except RuntimeError:
-            return None, "duplex pair read id(s) missing from pod5"
+    @util.catch_read_errors
+    def _make_read_pair_from_records(self, read_id_pair, pod5_reads):
+        """Build io.Read pair from pod5 records fetched for this pair
 
-        pod5_reads_filtered = {
-            str(read.read_id): read
-            for read in pod5_reads
-            if str(read.read_id) in read_id_pair
-        }
-        if len(pod5_reads_filtered) < 2:
+        Args:
+            read_id_pair (tuple): template and complement read ids
+            pod5_reads (dict): read id to list of pod5.ReadRecord objects
+        """
+        pair_reads = [pod5_reads.get(read_id, []) for read_id in read_id_pair]
+        if any(len(id_reads) == 0 for id_reads in pair_reads):
             return None, "duplex pair read id(s) missing from pod5"
-        if len(pod5_reads_filtered) > 2:
+        if any(len(id_reads) > 1 for id_reads in pair_reads):
             return None, "pod5 has multiple reads with the same id"
 
-        template_read_id, complement_read_id = read_id_pair
-        template_io_read = self._make_read(
-            pod5_reads_filtered[template_read_id]
-        )
+        template_io_read = self._make_read(pair_reads[0][0])
         if template_io_read is None:
             return None, "failed to find template in simplex bam"
 
-        complement_io_read = self._make_read(
-            pod5_reads_filtered[complement_read_id]
-        )
+        complement_io_read = self._make_read(pair_reads[1][0])
         if complement_io_read is None:
             return None, "failed to find complement in simplex bam"
 
         return (template_io_read, complement_io_read), None
 
+    def _fetch_pod5_reads(self, read_ids):
+        pod5_reads = {}
+        for read in self.reader.reads(
+            selection=list(read_ids), preload=["samples"]
+        ):
+            pod5_reads.setdefault(str(read.read_id), []).append(read)
+        return pod5_reads
+
+    def make_read_pair(self, read_id_pair: Tuple[str, str]):
+        try:
+            pod5_reads = self._fetch_pod5_reads(read_id_pair)
+        except RuntimeError:
+            return None, "duplex pair read id(s) missing from pod5"
+        return self._make_read_pair_from_records(read_id_pair, pod5_reads)
+
+    def make_read_pairs(self, read_id_pairs: List[Tuple[str, str]]):
+        """Build io.Read pairs for a batch of duplex pairs, fetching all
+        signals from the pod5 file with a single selection.
+
+        Args:
+            read_id_pairs (list): template and complement read id tuples
+
+        Returns:
+            List of ((io.Read, io.Read), error) tuples, one per input pair
+        """
+        try:
+            pod5_reads = self._fetch_pod5_reads(
+                set(read_id for pair in read_id_pairs for read_id in pair)
+            )
+        except RuntimeError:
+            # some read ids are missing from the pod5 file, so fall back to
+            # fetching each pair separately to attribute the error
+            return [self.make_read_pair(pair) for pair in read_id_pairs]
+        return [
+            self._make_read_pair_from_records(pair, pod5_reads)
+            for pair in read_id_pairs
+        ]
+
     def __enter__(self):
         return self
 
@@ -618,30 +1325,53 @@ class DuplexPairsBuilder:
         self.simplex_bam_handle.close()
 
 
-if _SIG_PROF_FN:
-    _iter_signal_wrapper = iter_signal
+def prep_extract_alignments(
+    bam_idx, bam_path, req_tags=REQUIRED_TAGS, ref_path=None
+):
+    pysam_save = pysam.set_verbosity(0)
+    bam_fh = pysam.AlignmentFile(bam_path, mode="rb", check_sq=False)
+    pysam.set_verbosity(pysam_save)
+    ref_cache = None if ref_path is None else ReferenceCache(ref_path)
+    return [bam_idx, bam_fh], {"req_tags": req_tags, "ref_cache": ref_cache}
 
-    def iter_signal(*args, **kwargs):
-        import cProfile
 
-        sig_prof = cProfile.Profile()
-        retval = sig_prof.runcall(_iter_signal_wrapper, *args, **kwargs)
-        sig_prof.dump_stats(_SIG_PROF_FN)
-        return retval
+def decode_move_tag(mv_tag):
+    """Decode move tag into stride and move table. The move table is a view
+    into the tag array to avoid converting each element.
 
+    Args:
+        mv_tag (array.array): Move tag value from pysam
 
-def prep_extract_alignments(bam_idx, bam_path, req_tags=REQUIRED_TAGS):
-    pysam_save = pysam.set_verbosity(0)
-    bam_fh = pysam.AlignmentFile(bam_path, mode="rb", check_sq=False)
-    pysam.set_verbosity(pysam_save)
-    return [bam_idx, bam_fh], {"req_tags": req_tags}
+    Returns:
+        2-tuple containing stride and move table array
+    """
+    mv_tag = np.asarray(mv_tag)
+    return int(mv_tag[0]), mv_tag[1:]
+
+
+def moves_to_query_to_signal(mv_table, stride, sig_len=None):
+    """Compute signal start position of each base from a move table.
+
+    Args:
+        mv_table (np.ndarray): Move table
+        stride (int): Move table stride
+        sig_len (int): If provided append signal length as final position
+
+    Returns:
+        np.ndarray of signal positions
+    """
+    moves = np.flatnonzero(mv_table)
+    if sig_len is None:
+        return moves * stride
+    query_to_signal = np.empty(moves.size + 1, dtype=np.int64)
+    np.multiply(moves, stride, out=query_to_signal[:-1])
+    query_to_signal[-1] = sig_len
+    return query_to_signal
 
 
 def parse_move_tag(mv_tag, sig_len, seq_len=None, check=True):
-    stride = mv_tag[0]
-    mv_table = np.array(mv_tag[1:])
-    query_to_signal = np.nonzero(mv_table)[0] * stride
-    query_to_signal = np.concatenate([query_to_signal, [sig_len]])
+    stride, mv_table = decode_move_tag(mv_tag)
+    query_to_signal = moves_to_query_to_signal(mv_table, stride, sig_len)
     if check and seq_len is not None and query_to_signal.size - 1 != seq_len:
         LOGGER.debug(
             f"Move table (num moves: {query_to_signal.size - 1}) discordant "
@@ -658,20 +1388,24 @@ def parse_move_tag(mv_tag, sig_len, seq_len=None, check=True):
 
 
 def extract_align_read(
-    io_read, bam_read, req_tags=REQUIRED_TAGS, parse_ref_align=True
+    io_read,
+    bam_read,
+    req_tags=REQUIRED_TAGS,
+    parse_ref_align=True,
+    ref_cache=None,
 ):
-    tags = dict(bam_read.tags)
-    if len(req_tags.intersection(tags)) != len(req_tags):
+    # only decode the tags used here as MM/ML tags may be very large
+    if not has_tags(bam_read, req_tags):
         return None
     try:
-        io_read.num_trimmed = tags["ts"]
+        io_read.num_trimmed = bam_read.get_tag("ts")
         io_read.signal = io_read.signal[io_read.num_trimmed :]
     except KeyError:
         io_read.num_trimmed = 0
 
     try:
         query_to_signal, mv_table, stride = parse_move_tag(
-            tags["mv"],
+            bam_read.get_tag("mv"),
             sig_len=io_read.signal.size,
             seq_len=len(bam_read.query_sequence),
         )
@@ -679,26 +1413,29 @@ def extract_align_read(
         raise RemoraError("Missing move table tag")
 
     try:
-        io_read.shift_pa_to_norm = tags["sm"]
-        io_read.scale_pa_to_norm = tags["sd"]
+        io_read.shift_pa_to_norm = bam_read.get_tag("sm")
+        io_read.scale_pa_to_norm = bam_read.get_tag("sd")
     except KeyError:
         io_read.set_pa_to_norm_scaling()
 
-    io_read.shift_dacs_to_norm = (
-        io_read.shift_pa_to_norm / io_read.scale_dacs_to_pa
-    ) - io_read.shift_dacs_to_pa
-    io_read.scale_dacs_to_norm = (
-        io_read.scale_pa_to_norm / io_read.scale_dacs_to_pa
+    (
+        io_read.shift_dacs_to_norm,
+        io_read.scale_dacs_to_norm,
+    ) = Read.compute_dacs_to_norm_scaling(
+        io_read.shift_pa_to_norm,
+        io_read.scale_pa_to_norm,
+        scale_dacs_to_pa=io_read.scale_dacs_to_pa,
+        offset_dacs_to_pa=io_read.shift_dacs_to_pa,
     )
 
-    align_read = copy(io_read)
+    align_read = io_read.copy()
     align_read.seq = bam_read.query_sequence
     if bam_read.is_reverse:
         align_read.seq = util.revcomp(align_read.seq)
     align_read.stride = stride
     align_read.mv_table = mv_table
     align_read.query_to_signal = query_to_signal
-    align_read.full_align = bam_read.to_dict()
+    align_read.full_align_str = bam_read.to_string()
     if not parse_ref_align:
         return align_read
 
@@ -707,31 +1444,42 @@ def extract_align_read(
         strand="-" if bam_read.is_reverse else "+",
         start=bam_read.reference_start,
     )
-    try:
-        align_read.ref_seq = bam_read.get_reference_sequence().upper()
-    except ValueError:
-        align_read.ref_seq = None
+    if ref_cache is not None and not bam_read.is_unmapped:
+        align_read.ref_seq = ref_cache.get_reference_sequence(bam_read)
+    else:
+        try:
+            align_read.ref_seq = bam_read.get_reference_sequence().upper()
+        except ValueError:
+            align_read.ref_seq = None
     align_read.cigar = bam_read.cigartuples
     if bam_read.is_reverse:
         align_read.ref_seq = util.revcomp(align_read.ref_seq)
-        align_read.cigar = align_read.cigar[::-1]
+        align_read.cigar.reverse()
     return align_read
 
 
-def extract_alignments(read_err, bam_idx, bam_fh, req_tags=REQUIRED_TAGS):
+@util.maybe_profile("REMORA_EXTRACT_ALIGN_PROFILE_FILE")
+def extract_alignments(
+    read_err, bam_idx, bam_fh, req_tags=REQUIRED_TAGS, ref_cache=None
+):
     io_read, err = read_err
     if io_read is None:
         return [read_err]
-    if io_read.read_id not in bam_idx:
+    try:
+        read_bam_ptrs = bam_idx[io_read.read_id]
+    except KeyError:
         return [tuple((None, "Read id not found in BAM file"))]
     read_alignments = []
-    for read_bam_ptr in bam_idx[io_read.read_id]:
-        # jump to bam read pointer
-        bam_fh.seek(read_bam_ptr)
+    for read_bam_ptr in read_bam_ptrs:
+        # jump to bam read pointer. Seeking decompresses the BGZF block
+        # again, so skip it when the file is already positioned at this
+        # record (e.g. adjacent records for this read or reads in file order)
+        if bam_fh.tell() != read_bam_ptr:
+            bam_fh.seek(read_bam_ptr)
         bam_read = next(bam_fh)
         try:
             align_read = extract_align_read(
-                io_read, bam_read, req_tags=req_tags
+                io_read, bam_read, req_tags=req_tags, ref_cache=ref_cache
             )
             if align_read is None:
                 # invalid tag errors should already be logged
@@ -743,18 +1491,6 @@ def extract_alignments(read_err, bam_idx, bam_fh, req_tags=REQUIRED_TAGS):
     return read_alignments
 
 
-if _ALIGN_PROF_FN:
-    _extract_align_wrapper = extract_alignments
-
-    def extract_alignments(*args, **kwargs):
-        import cProfile
-
-        align_prof = cProfile.Profile()
-        retval = align_prof.runcall(_extract_align_wrapper, *args, **kwargs)
-        align_prof.dump_stats(_ALIGN_PROF_FN)
-        return retval
-
-
 ##########################
 # Alignments then signal #
 ##########################
@@ -770,24 +1506,31 @@ def iter_alignments(
                 return
             if skip_non_primary and not read_is_primary(read):
                 continue
-            tags = dict(read.tags)
-            if len(req_tags.intersection(tags)) != len(req_tags):
+            if not has_tags(read, req_tags):
                 continue
-            mv_tag = tags["mv"]
-            stride = mv_tag[0]
-            mv_table = np.array(mv_tag[1:])
-            query_to_signal = np.nonzero(mv_table)[0] * stride
-            if query_to_signal.size != len(read.query_sequence):
+            stride, mv_table = decode_move_tag(read.get_tag("mv"))
+            # the final position is set to the signal length once the signal
+            # is added (add_read_signal)
+            query_to_signal = moves_to_query_to_signal(
+                mv_table, stride, sig_len=mv_table.size * stride
+            )
+            if query_to_signal.size - 1 != len(read.query_sequence):
                 yield None, "Move table discordant with basecalls"
             try:
-                num_trimmed = tags["ts"]
+                num_trimmed = read.get_tag("ts")
             except KeyError:
                 num_trimmed = 0
+            shift_pa_to_norm = (
+                read.get_tag("sm") if read.has_tag("sm") else None
+            )
+            scale_pa_to_norm = (
+                read.get_tag("sd") if read.has_tag("sd") else None
+            )
             ref_seq = read.get_reference_sequence().upper()
             cigar = read.cigartuples
             if read.is_reverse:
                 ref_seq = util.revcomp(ref_seq)
-                cigar = cigar[::-1]
+                cigar.reverse()
             ref_pos = RefPos(
                 ctg=read.reference_name,
                 strand="-" if read.is_reverse else "+",
@@ -801,12 +1544,12 @@ def iter_alignments(
                     mv_table=mv_table,
                     query_to_signal=query_to_signal,
                     num_trimmed=num_trimmed,
-                    shift_pa_to_norm=tags.get("sm"),
-                    scale_pa_to_norm=tags.get("sd"),
+                    shift_pa_to_norm=shift_pa_to_norm,
+                    scale_pa_to_norm=scale_pa_to_norm,
                     ref_seq=ref_seq,
                     ref_pos=ref_pos,
                     cigar=cigar,
-                    full_align=read.to_dict(),
+                    full_align_str=read.to_string(),
                 ),
                 None,
             )
@@ -820,23 +1563,90 @@ def prep_extract_signal(pod5_path):
     ], {}
 
 
-def extract_signal(read_err, pod5_fh):
-    read, err = read_err
-    if read is None:
-        return [read_err]
-    pod5_read = next(pod5_fh.reads([read.read_id]))
+def iter_alignment_batches(
+    bam_path,
+    num_reads,
+    skip_non_primary,
+    req_tags=REQUIRED_TAGS,
+    batch_size=constants.POD5_READ_BATCH_SIZE,
+):
+    batch = []
+    for read_err in iter_alignments(
+        bam_path, num_reads, skip_non_primary, req_tags=req_tags
+    ):
+        batch.append(read_err)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if len(batch) > 0:
+        yield batch
+
+
+@util.catch_read_errors
+def add_read_signal(read, pod5_read):
     read.signal = pod5_read.signal[read.num_trimmed :]
-    read.query_to_signal = np.concatenate(
-        [read.query_to_signal, [read.signal.size]]
-    )
+    read.query_to_signal[-1] = read.signal.size
     if read.mv_table.size != read.signal.size // read.stride:
-        return [tuple((None, "Move table discordant with signal"))]
+        return tuple((None, "Move table discordant with signal"))
     read.shift_dacs_to_pa = pod5_read.calibration.offset
     read.scale_dacs_to_pa = pod5_read.calibration.scale
     if read.shift_pa_to_norm is None or read.scale_pa_to_norm is None:
         read.set_pa_to_norm_scaling()
-    read.shift_dacs_to_norm = (
-        read.shift_pa_to_norm / read.scale_dacs_to_pa
-    ) - read.shift_dacs_to_pa
-    read.scale_dacs_to_norm = read.scale_pa_to_norm / read.scale_dacs_to_pa
-    return [tuple((read, None))]
+    (
+        read.shift_dacs_to_norm,
+        read.scale_dacs_to_norm,
+    ) = Read.compute_dacs_to_norm_scaling(
+        read.shift_pa_to_norm,
+        read.scale_pa_to_norm,
+        scale_dacs_to_pa=read.scale_dacs_to_pa,
+        offset_dacs_to_pa=read.shift_dacs_to_pa,
+    )
+    return tuple((read, None))
+
+
+def _fetch_pod5_reads(pod5_fh, read_ids):
+    return dict(
+        (str(pod5_read.read_id), pod5_read)
+        for pod5_read in pod5_fh.reads(
+            selection=list(read_ids), preload=["samples"]
+        )
+    )
+
+
+def extract_signal_batch(read_errs, pod5_fh):
+    """Add signal to a batch of reads, fetching all reads from the pod5 file
+    with a single selection.
+
+    Args:
+        read_errs (list): (io.Read, error) tuples as produced by
+            iter_alignment_batches
+        pod5_fh (pod5.Reader): open pod5 file handle
+
+    Returns:
+        List of (io.Read, error) tuples
+    """
+    read_ids = set(read.read_id for read, _ in read_errs if read is not None)
+    try:
+        pod5_reads = _fetch_pod5_reads(pod5_fh, read_ids)
+    except RuntimeError:
+        # some read ids are missing from the pod5 file, so fall back to
+        # fetching reads separately to skip only the missing reads
+        pod5_reads = {}
+        for read_id in read_ids:
+            try:
+                pod5_reads.update(_fetch_pod5_reads(pod5_fh, [read_id]))
+            except RuntimeError:
+                continue
+    signal_read_errs = []
+    for read, err in read_errs:
+        if read is None:
+            signal_read_errs.append(tuple((read, err)))
+        elif read.read_id not in pod5_reads:
+            signal_read_errs.append(
+                tuple((None, "Read id not found in POD5 file"))
+            )
+        else:
+            signal_read_errs.append(
+                add_read_signal(read, pod5_reads[read.read_id])
+            )
+    return signal_read_errs
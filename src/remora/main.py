@@ -1,8 +1,8 @@
-import os
 import argparse
 import warnings
 
 from remora import __version__
+from remora.util import maybe_profile
 
 # from remora.common import logging
 from remora.parsers import (
@@ -18,13 +18,6 @@ warnings.filterwarnings(action="ignore", category=UserWarning, module="torch")
 
 # LOGGER = logging.get_logger()
 
-_DO_PROFILE = False
-# None if environment var not set
-_PROF_FN = os.getenv("REMORA_PROFILE_FILE")
-if _PROF_FN:
-    _DO_PROFILE = True
-    # LOGGER.warning(f"Profiling remora. Saving profile data to {_PROF_FN}")
-
 
 def run():
     """The main routine."""
@@ -54,18 +47,7 @@ def run():
     register_validate(subparsers)
 
     args = parser.parse_args()
-    cmd_func = args.func
-    if _DO_PROFILE:
-        _func_wrapper = cmd_func
-
-        def cmd_func(args):
-            import cProfile
-
-            prof = cProfile.Profile()
-            retval = prof.runcall(_func_wrapper, args)
-            prof.dump_stats(_PROF_FN)
-            return retval
-
+    cmd_func = maybe_profile("REMORA_PROFILE_FILE")(args.func)
     cmd_func(args)
 
 
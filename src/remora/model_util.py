@@ -366,7 +366,9 @@ def repr_model_metadata(metadata):
     )
 
 
-def load_torchscript_model(model_filename, device=None, quiet=False):
+def load_torchscript_model(
+    model_filename, device=None, quiet=False, half=False
+):
     """Load torchscript model. If device is specified load onto specified
     device.
 
@@ -374,6 +376,8 @@ def load_torchscript_model(model_filename, device=None, quiet=False):
         model_filename (str): Model path
         device (int): GPU device ID
         quiet (bool): Print model info to debug
+        half (bool): Convert model to half precision. Only applied when a GPU
+            device is specified.
 
     Returns:
         2-tuple containing:
@@ -393,6 +397,15 @@ def load_torchscript_model(model_filename, device=None, quiet=False):
             _extra_files=extra_files,
             map_location=torch.device(device),
         )
+    if half:
+        if device is None:
+            LOGGER.warning(
+                "Half precision inference requires a GPU device. Using full "
+                "precision model."
+            )
+        else:
+            model = model.half()
+    model.eval()
     model_metadata = json.loads(extra_files["meta.txt"])
     add_derived_metadata(model_metadata)
     if not quiet:
@@ -412,6 +425,7 @@ def load_model(
     remora_model_version=None,
     device=None,
     quiet=True,
+    half=False,
 ):
     if model_filename is not None:
         if not isfile(model_filename):
@@ -420,7 +434,9 @@ def load_model(
             )
         try:
             LOGGER.debug("Using torchscript model")
-            return load_torchscript_model(model_filename, device, quiet=quiet)
+            return load_torchscript_model(
+                model_filename, device, quiet=quiet, half=half
+            )
         except (AttributeError, RuntimeError):
             raise RemoraError("Failed loading torchscript model.")
 
@@ -543,7 +559,7 @@ def load_model(
         md = ModelDownload(path)
         md.download(url)
     try:
-        return load_torchscript_model(full_path, device)
+        return load_torchscript_model(full_path, device, half=half)
     except (AttributeError, RuntimeError):
         raise RemoraError("Failed loading torchscript model.")
 
@@ -937,6 +937,18 @@ def register_infer_from_pod5_and_bam(parser):
         help="Infer per-read modified bases against reference bases instead "
         "of basecalls.",
     )
+    data_grp.add_argument(
+        "--reference-fasta",
+        help="Indexed FASTA file to which reads were mapped. Reference "
+        "sequence for --reference-anchored inference is read from this file "
+        "instead of being reconstructed from the BAM MD tags.",
+    )
+    data_grp.add_argument(
+        "--cache-bam-index",
+        action="store_true",
+        help="Save BAM read index next to the BAM file and reuse it on later "
+        "runs while the BAM file is unchanged.",
+    )
 
     comp_grp = subparser.add_argument_group("Compute Arguments")
     comp_grp.add_argument(
@@ -944,6 +956,12 @@ def register_infer_from_pod5_and_bam(parser):
         type=int,
         help="ID of GPU that is used for inference. Default: CPU only",
     )
+    comp_grp.add_argument(
+        "--half",
+        action="store_true",
+        help="Run inference with a half precision model. Only applied when "
+        "a GPU device is specified. Ignored with a warning on CPU.",
+    )
     comp_grp.add_argument(
         "--num-extract-alignment-workers",
         type=int,
@@ -960,8 +978,8 @@ def register_infer_from_pod5_and_bam(parser):
         "--num-infer-workers",
         type=int,
         default=1,
-        help="Number of chunk extraction workers. If performing signal "
-        "refinement this should be increased. Default: %(default)d",
+        help="Number of model inference and tag formatting workers. A single "
+        "model inference worker is used for GPU devices. Default: %(default)d",
     )
     comp_grp.add_argument(
         "--batch-size",
@@ -1061,6 +1079,12 @@ def register_infer_duplex_from_pod5_and_bam(parser):
         type=int,
         help="Number of reads.",
     )
+    data_grp.add_argument(
+        "--cache-bam-index",
+        action="store_true",
+        help="Save BAM read index next to the BAM file and reuse it on later "
+        "runs while the BAM file is unchanged.",
+    )
 
     comp_grp = subparser.add_argument_group("Compute Arguments")
     comp_grp.add_argument(
@@ -1068,6 +1092,12 @@ def register_infer_duplex_from_pod5_and_bam(parser):
         type=int,
         help="ID of GPU that is used for inference. Default: CPU only",
     )
+    comp_grp.add_argument(
+        "--half",
+        action="store_true",
+        help="Run inference with a half precision model. Only applied when "
+        "a GPU device is specified. Ignored with a warning on CPU.",
+    )
     comp_grp.add_argument(
         "--num-extract-alignment-workers",
         type=int,
@@ -1105,6 +1135,7 @@ def _unpack_model_kw_args(args) -> dict:
         "remora_model_type": args.remora_model_type,
         "remora_model_version": args.remora_model_version,
         "device": args.device,
+        "half": args.half,
     }
     return model_kwargs
 
@@ -1130,6 +1161,8 @@ def run_infer_from_pod5_and_bam(args):
         num_infer_workers=args.num_infer_workers,
         batch_size=args.batch_size,
         ref_anchored=args.reference_anchored,
+        cache_bam_index=args.cache_bam_index,
+        reference_fasta=args.reference_fasta,
     )
 
 
@@ -1166,6 +1199,7 @@ def run_infer_from_pod5_and_bam_duplex(args):
         num_infer_threads=args.num_infer_workers,
         num_reads=args.num_reads,
         duplex_deliminator=args.duplex_delim,
+        cache_bam_index=args.cache_bam_index,
     )
 
 
@@ -1391,7 +1425,11 @@ def run_validate_from_remora_dataset(args):
     if args.full_results_filename is None:
         full_results_fp = None
     else:
-        full_results_fp = open(args.full_results_filename, "w", buffering=1)
+        full_results_fp = open(
+            args.full_results_filename,
+            "w",
+            buffering=constants.FULL_RESULTS_BUFFER_SIZE,
+        )
         atexit.register(full_results_fp.close)
 
     LOGGER.info("Running validation")
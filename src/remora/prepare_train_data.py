@@ -6,8 +6,14 @@ import pysam
 import numpy as np
 from tqdm import tqdm
 
-from remora import log, RemoraError
-from remora.util import MultitaskMap, BackgroundIter
+from remora import constants, log, RemoraError
+from remora.util import (
+    MultitaskMap,
+    BackgroundIter,
+    catch_read_errors,
+    DEFAULT_QUEUE_SIZE,
+    BATCH_QUEUE_SIZE,
+)
 from remora.data_chunks import (
     RemoraRead,
     RemoraDataset,
@@ -16,8 +22,8 @@ from remora.data_chunks import (
 from remora.io import (
     index_bam,
     iter_signal,
-    extract_signal,
-    iter_alignments,
+    extract_signal_batch,
+    iter_alignment_batches,
     read_is_primary,
     extract_alignments,
     prep_extract_signal,
@@ -33,6 +39,97 @@ LOGGER = log.get_logger()
 ####################
 
 
+@catch_read_errors
+def extract_read_chunks(
+    io_read,
+    read_idx,
+    int_label,
+    motifs,
+    focus_ref_pos,
+    sig_map_refiner,
+    max_chunks_per_read,
+    chunk_context,
+    kmer_context_bases,
+    base_pred,
+    base_start_justify,
+    offset,
+    randomer_length,
+    randomer_error_bases,
+    beg_known_seq,
+    end_known_seq,
+    focus_offset,
+    basecall_anchored,
+):
+    """Extract chunks from a single read alignment.
+
+    Returns:
+        2-tuple containing list of chunks and error, or None if the read
+        fails checks after preparation
+    """
+    if basecall_anchored:
+        remora_read = io_read.into_remora_read(use_reference_anchor=False)
+        remora_read.focus_bases = io_read.get_base_call_anchored_focus_bases(
+            motifs=motifs,
+            randomer_length=randomer_length,
+            randomer_error_bases=randomer_error_bases,
+            beg_known_seq=beg_known_seq,
+            end_known_seq=end_known_seq,
+            focus_offset=focus_offset,
+            select_focus_reference_positions=focus_ref_pos,
+        )
+        remora_read.labels = np.full(len(io_read.seq), int_label, dtype=int)
+    else:
+        io_read.ref_to_signal = compute_ref_to_signal(
+            io_read.query_to_signal,
+            io_read.cigar,
+            query_seq=io_read.seq,
+            ref_seq=io_read.ref_seq,
+        )
+        trim_signal = io_read.signal[
+            io_read.ref_to_signal[0] : io_read.ref_to_signal[-1]
+        ]
+        shift_ref_to_sig = io_read.ref_to_signal - io_read.ref_to_signal[0]
+        remora_read = RemoraRead(
+            dacs=trim_signal,
+            shift=io_read.shift_dacs_to_norm,
+            scale=io_read.scale_dacs_to_norm,
+            seq_to_sig_map=shift_ref_to_sig,
+            str_seq=io_read.ref_seq,
+            labels=np.full(len(io_read.ref_seq), int_label, dtype=int),
+            read_id=io_read.read_id,
+        )
+        if focus_ref_pos is not None:
+            # todo(arand) make a test that exercises this code path
+            remora_read.focus_bases = io_read.get_filtered_focus_positions(
+                focus_ref_pos
+            )
+        else:
+            remora_read.set_motif_focus_bases(motifs)
+
+    remora_read.refine_signal_mapping(sig_map_refiner)
+    remora_read.downsample_focus_bases(max_chunks_per_read)
+    try:
+        remora_read.check()
+    except RemoraError as e:
+        LOGGER.debug(f"Read prep failed: {e}")
+        return None
+    read_align_chunks = list(
+        remora_read.iter_chunks(
+            chunk_context,
+            kmer_context_bases,
+            base_pred,
+            base_start_justify,
+            offset,
+            check_chunks=True,
+        )
+    )
+    LOGGER.debug(
+        f"extracted {len(read_align_chunks)} chunks from {io_read.read_id} "
+        f"alignment {read_idx}"
+    )
+    return read_align_chunks, None
+
+
 def extract_chunks(
     read_errs,
     int_label,
@@ -63,70 +160,28 @@ def extract_chunks(
         #         tuple((None, "No reference sequence (missing MD tag)"))
         #     )
         #     continue
-        if basecall_anchored:
-            remora_read = io_read.into_remora_read(use_reference_anchor=False)
-            remora_read.focus_bases = (
-                io_read.get_base_call_anchored_focus_bases(
-                    motifs=motifs,
-                    randomer_length=randomer_length,
-                    randomer_error_bases=randomer_error_bases,
-                    beg_known_seq=beg_known_seq,
-                    end_known_seq=end_known_seq,
-                    focus_offset=focus_offset,
-                    select_focus_reference_positions=focus_ref_pos,
-                )
-            )
-            remora_read.labels = np.full(len(io_read.seq), int_label, dtype=int)
-        else:
-            io_read.ref_to_signal = compute_ref_to_signal(
-                io_read.query_to_signal,
-                io_read.cigar,
-                query_seq=io_read.seq,
-                ref_seq=io_read.ref_seq,
-            )
-            trim_signal = io_read.signal[
-                io_read.ref_to_signal[0] : io_read.ref_to_signal[-1]
-            ]
-            shift_ref_to_sig = io_read.ref_to_signal - io_read.ref_to_signal[0]
-            remora_read = RemoraRead(
-                dacs=trim_signal,
-                shift=io_read.shift_dacs_to_norm,
-                scale=io_read.scale_dacs_to_norm,
-                seq_to_sig_map=shift_ref_to_sig,
-                str_seq=io_read.ref_seq,
-                labels=np.full(len(io_read.ref_seq), int_label, dtype=int),
-                read_id=io_read.read_id,
-            )
-            if focus_ref_pos is not None:
-                # todo(arand) make a test that exercises this code path
-                remora_read.focus_bases = io_read.get_filtered_focus_positions(
-                    focus_ref_pos
-                )
-            else:
-                remora_read.set_motif_focus_bases(motifs)
-
-        remora_read.refine_signal_mapping(sig_map_refiner)
-        remora_read.downsample_focus_bases(max_chunks_per_read)
-        try:
-            remora_read.check()
-        except RemoraError as e:
-            LOGGER.debug(f"Read prep failed: {e}")
-            continue
-        read_align_chunks = list(
-            remora_read.iter_chunks(
-                chunk_context,
-                kmer_context_bases,
-                base_pred,
-                base_start_justify,
-                offset,
-                check_chunks=True,
-            )
-        )
-        LOGGER.debug(
-            f"extracted {len(read_align_chunks)} chunks from {io_read.read_id} "
-            f"alignment {read_idx}"
+        read_chunks_err = extract_read_chunks(
+            io_read,
+            read_idx,
+            int_label,
+            motifs,
+            focus_ref_pos,
+            sig_map_refiner,
+            max_chunks_per_read,
+            chunk_context,
+            kmer_context_bases,
+            base_pred,
+            base_start_justify,
+            offset,
+            randomer_length,
+            randomer_error_bases,
+            beg_known_seq,
+            end_known_seq,
+            focus_offset,
+            basecall_anchored,
         )
-        read_chunks.append(tuple((read_align_chunks, None)))
+        if read_chunks_err is not None:
+            read_chunks.append(read_chunks_err)
 
     return read_chunks
 
@@ -165,7 +220,11 @@ def extract_chunk_dataset(
     base_call_anchor=True,
 ):
     if signal_first:
-        bam_idx, num_bam_reads = index_bam(bam_fn, skip_non_primary)
+        bam_idx, num_bam_reads = index_bam(
+            bam_fn,
+            skip_non_primary,
+            num_workers=num_extract_alignment_threads,
+        )
         with pod5.Reader(Path(pod5_path)) as pod5_fp:
             num_pod5_reads = sum(1 for _ in pod5_fp.reads())
             LOGGER.info(
@@ -231,18 +290,21 @@ def extract_chunk_dataset(
         )
 
     else:
+        # batch mappings to fetch signal with one pod5 selection per batch
         mappings = BackgroundIter(
-            iter_alignments,
+            iter_alignment_batches,
             args=(bam_fn, num_reads, skip_non_primary),
+            q_maxsize=BATCH_QUEUE_SIZE,
             name="ExtractMappings",
             use_process=True,
         )
         reads = MultitaskMap(
-            extract_signal,
+            extract_signal_batch,
             mappings,
             prep_func=prep_extract_signal,
             num_workers=num_extract_alignment_threads,
             args=(pod5_path,),
+            q_maxsize=BATCH_QUEUE_SIZE,
             name="AddSignal",
             use_process=True,
         )
@@ -250,6 +312,7 @@ def extract_chunk_dataset(
         extract_chunks,
         reads,
         num_workers=num_extract_chunks_threads,
+        q_maxsize=DEFAULT_QUEUE_SIZE if signal_first else BATCH_QUEUE_SIZE,
         args=[
             0 if mod_base_control else 1,
             motifs,
@@ -272,12 +335,15 @@ def extract_chunk_dataset(
         use_process=True,
     )
 
+    # each item of chunks covers a batch of reads when mappings come first
+    reads_per_item = 1 if signal_first else constants.POD5_READ_BATCH_SIZE
     errs = defaultdict(int)
     for read_chunks in tqdm(
         chunks,
-        total=num_reads,
+        total=-(-num_reads // reads_per_item),
         smoothing=0,
         unit=" Reads",
+        unit_scale=False if signal_first else reads_per_item,
         desc="Extracting chunks",
     ):
         if len(read_chunks) == 0:
@@ -294,6 +294,15 @@ def train_model(
         **dataset.sig_map_refiner.get_save_kwargs(),
     }
     bb, ab = dataset.kmer_context_bases
+    # encoded k-mers are consumed within each batch so reuse a single buffer
+    enc_kmers_buf = np.empty(
+        (
+            trn_ds.batch_size,
+            4 * (bb + ab + 1),
+            sum(trn_ds.chunk_context),
+        ),
+        dtype=np.float32,
+    )
     best_val_acc = 0
     early_stop_epochs = 0
     breached = False
@@ -307,7 +316,7 @@ def train_model(
             sigs = torch.from_numpy(sigs)
             enc_kmers = torch.from_numpy(
                 encoded_kmers.compute_encoded_kmer_batch(
-                    bb, ab, seqs, seq_maps, seq_lens
+                    bb, ab, seqs, seq_maps, seq_lens, out=enc_kmers_buf
                 )
             )
             labels = torch.from_numpy(labels)
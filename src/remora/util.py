@@ -1,16 +1,21 @@
+import os
 import array
+import inspect
+import functools
 import multiprocessing as mp
 import platform
 import queue
 import re
+import string
 import traceback
+import dataclasses
 from time import sleep
 from threading import Thread
 from os.path import realpath, expanduser
 
 import numpy as np
 
-from remora import log, RemoraError
+from remora import constants, log, RemoraError
 
 LOGGER = log.get_logger()
 
@@ -40,12 +45,16 @@ SEQ_TO_INT_ARR[2] = 1
 SEQ_TO_INT_ARR[6] = 2
 SEQ_TO_INT_ARR[19] = 3
 COMP_BASES = dict(zip(map(ord, "ACGT"), map(ord, "TGCA")))
+# upper case and complement in a single translate call
+REVCOMP_BASES = str.maketrans(string.ascii_lowercase, string.ascii_uppercase)
+REVCOMP_BASES.update(str.maketrans("ACGTacgt", "TGCATGCA"))
 NP_COMP_BASES = np.array([3, 2, 1, 0], dtype=np.uintp)
 U_TO_T_BASES = {ord("U"): ord("T")}
 
-CAN_LETTERS = {i: CAN_ALPHABET[SEQ_TO_INT_ARR[ord(base) - ord('A')]] for i, base in enumerate("ACGT")}
-
 DEFAULT_QUEUE_SIZE = 10_000
+# queue size for pipeline stages passing batches of POD5_READ_BATCH_SIZE
+# reads, so each queue holds about as many reads as DEFAULT_QUEUE_SIZE items
+BATCH_QUEUE_SIZE = max(1, DEFAULT_QUEUE_SIZE // constants.POD5_READ_BATCH_SIZE)
 
 
 def iter_motif_hits(int_seq, motif):
@@ -65,11 +74,8 @@ def iter_motif_hits(int_seq, motif):
 
 
 def find_focus_bases_in_int_sequence(int_seq: np.ndarray, randomer_length: int, randomer_error_bases: int, beg_known_seq: str,end_known_seq: str, focus_offset: int) -> np.ndarray:
-    result = []
-
-
     # Convert int_seq to a string of bases
-    seq_str = "".join(CAN_LETTERS[b] for b in int_seq)
+    seq_str = int_to_seq(int_seq, CAN_ALPHABET)
 
     # Search for the motif directly
     randomer_length_lower_bound = randomer_length - randomer_error_bases
@@ -77,12 +83,11 @@ def find_focus_bases_in_int_sequence(int_seq: np.ndarray, randomer_length: int,
     regex_pattern = beg_known_seq + "(.{" + str(randomer_length_lower_bound) + ','+str(randomer_length_upper_bound)+"})" + end_known_seq
     matches = re.finditer(regex_pattern, seq_str)
 
-    # Add the focus position to the result
-    for match in matches:
-        focus_pos = match.start() + len(beg_known_seq) + focus_offset
-        result.append(focus_pos)
-
-    return np.array(result, dtype=int)
+    # Add the focus offset to all match starts at once
+    match_starts = np.fromiter(
+        (match.start() for match in matches), dtype=np.int64
+    )
+    return match_starts + (len(beg_known_seq) + focus_offset)
 
 
 def comp(seq):
@@ -90,7 +95,7 @@ def comp(seq):
 
 
 def revcomp(seq):
-    return seq.upper().translate(COMP_BASES)[::-1]
+    return seq.translate(REVCOMP_BASES)[::-1]
 
 
 def comp_np(np_seq):
@@ -132,7 +137,11 @@ def int_to_seq(np_seq, alphabet=CONV_ALPHABET):
         return ""
     if np_seq.max() >= len(alphabet):
         raise RemoraError(f"Invalid value in int sequence ({np_seq.max()})")
-    return "".join(alphabet[b] for b in np_seq)
+    return (
+        np.frombuffer(alphabet.encode(), dtype=np.uint8)[np_seq]
+        .tobytes()
+        .decode()
+    )
 
 
 def resolve_path(fn_path):
@@ -156,6 +165,25 @@ def to_str(value):
         return value
 
 
+def add_slots(cls):
+    """Class decorator to recreate a dataclass with __slots__ for its fields,
+    equivalent to dataclass(slots=True) which is only available from python
+    3.10. Apply above the dataclass decorator. Field defaults are kept by
+    the generated __init__.
+    """
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(fld.name for fld in dataclasses.fields(cls))
+    cls_dict["__slots__"] = field_names
+    for name in field_names:
+        # remove class attribute defaults which would conflict with slots
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    slots_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slots_cls.__qualname__ = cls.__qualname__
+    return slots_cls
+
+
 def softmax_axis1(x):
     """Compute softmax over axis=1"""
     e_x = np.exp((x.T - np.max(x, axis=1)).T)
@@ -163,6 +191,20 @@ def softmax_axis1(x):
         return (e_x.T / e_x.sum(axis=1)).T
 
 
+def softmax_axis1_mod_probs(x):
+    """Compute softmax over axis=1 returning only the modified base
+    probabilities (all but the first column) as float64. Equivalent to
+    softmax_axis1(x)[:, 1:].astype(np.float64) without the intermediate full
+    softmax and cast arrays.
+    """
+    e_x = x - x.max(axis=1, keepdims=True)
+    np.exp(e_x, out=e_x)
+    probs = np.empty((x.shape[0], x.shape[1] - 1), dtype=np.float64)
+    with np.errstate(divide="ignore"):
+        np.divide(e_x[:, 1:], e_x.sum(axis=1, keepdims=True), out=probs)
+    return probs
+
+
 class Motif:
     def __init__(self, raw_motif, focus_pos=0):
         self.raw_motif = raw_motif
@@ -331,11 +373,116 @@ def format_mm_ml_tags(seq, poss, probs, mod_bases, can_base, strand: str = "+"):
     return mm_tag, ml_tag
 
 
+#############
+# Profiling #
+#############
+
+
+# per output path profile state shared by all functions decorated with the
+# same environment variable
+_PROFILES = {}
+
+
+def _get_profile(prof_fn):
+    """Get the profile for this process writing to prof_fn, creating it and
+    registering the dump on process exit on first use.
+    """
+    import cProfile
+    from multiprocessing import util as mp_util
+
+    pid = os.getpid()
+    state = _PROFILES.get(prof_fn)
+    if state is None or state["pid"] != pid:
+        prof = cProfile.Profile()
+        out_fn = (
+            prof_fn
+            if mp.current_process().name == "MainProcess"
+            else f"{prof_fn}.{pid}"
+        )
+        mp_util.Finalize(prof, prof.dump_stats, (out_fn,), exitpriority=0)
+        state = _PROFILES[prof_fn] = {"pid": pid, "prof": prof, "active": False}
+    return state
+
+
+def maybe_profile(env_var):
+    """Decorator to profile a function when the environment variable is set
+    to an output path. Calls within a process accumulate into a single
+    profile which is written when the process exits. Profiles from worker
+    processes are written to the output path suffixed with the process id.
+    When the variable is not set the function is returned unchanged.
+
+    Generator functions are profiled while producing each item.
+
+    Args:
+        env_var (str): Name of environment variable holding the output path
+    """
+    prof_fn = os.getenv(env_var)
+    if not prof_fn:
+        return lambda func: func
+
+    def profile_call(func, *args, **kwargs):
+        state = _get_profile(prof_fn)
+        # nested or concurrent (threaded) calls run within the active call
+        if state["active"]:
+            return func(*args, **kwargs)
+        state["active"] = True
+        try:
+            return state["prof"].runcall(func, *args, **kwargs)
+        finally:
+            state["active"] = False
+
+    def decorator(func):
+        if inspect.isgeneratorfunction(func):
+
+            @functools.wraps(func)
+            def gen_wrapper(*args, **kwargs):
+                gen = func(*args, **kwargs)
+                while True:
+                    try:
+                        item = profile_call(next, gen)
+                    except StopIteration:
+                        return
+                    yield item
+
+            return gen_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return profile_call(func, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
 ###################
 # Multiprocessing #
 ###################
 
 
+def catch_read_errors(func):
+    """Decorator for functions processing a single read (or read pair) and
+    returning a (result, error) tuple. Exceptions are returned as the error
+    so that a failure on one read does not drop the other reads in a batch
+    processed by a MultitaskMap worker.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except RemoraError as e:
+            return None, str(e)
+        except Exception as e:
+            LOGGER.debug(
+                f"UNEXPECTED_ERROR in {func.__name__}: '{e}'.\n"
+                f"Full traceback: {traceback.format_exc()}"
+            )
+            return None, f"Unexpected error ({type(e).__name__})"
+
+    return wrapper
+
+
 def _put_item(item, out_q):
     """Put item into queue with timeout to handle KeyboardInterrupt"""
     while True:
@@ -5,7 +5,6 @@ from collections import defaultdict, namedtuple
 import torch
 import pysam
 import numpy as np
-import pandas as pd
 from torch import nn
 from tqdm import tqdm
 from sklearn.metrics import confusion_matrix
@@ -68,8 +67,8 @@ def add_unmodeled_labels(output, unmodeled_labels):
     """Add unmodeled labels into the neural network output for validation.
 
     Args:
-        output (np.array): Output from a Remora neural network.
-            Shape: (batch, modeled_labels)
+        output (np.array or torch.Tensor): Output from a Remora neural
+            network. Shape: (batch, modeled_labels)
         unmodeled_labels (np.array): Indices of unmodled labels in desired
             output
 
@@ -86,7 +85,10 @@ def add_unmodeled_labels(output, unmodeled_labels):
     n_new_lab = nlab + unmodeled_labels.size
     # fill with large negative number since this is the model output which
     # will be softmax-ed to get probabilities
-    new_output = np.full((nobs, n_new_lab), -1000, dtype=output.dtype)
+    if isinstance(output, torch.Tensor):
+        new_output = output.new_full((nobs, n_new_lab), -1000)
+    else:
+        new_output = np.full((nobs, n_new_lab), -1000, dtype=output.dtype)
     new_output[:, 0] = output[:, 0]
     unused_idx = 0
     for idx in range(1, n_new_lab):
@@ -120,8 +122,17 @@ def _validate_model(
         torch.set_grad_enabled(False)
 
     bb, ab = dataset.kmer_context_bases
+    # encoded k-mers are consumed within each batch so reuse a single buffer
+    enc_kmers_buf = np.empty(
+        (
+            dataset.batch_size,
+            4 * (bb + ab + 1),
+            sum(dataset.chunk_context),
+        ),
+        dtype=np.float32,
+    )
     all_labels = []
-    all_outputs = []
+    all_probs = []
     all_loss = []
     ds_iter = (
         tqdm(dataset, smoothing=0, desc="Batches")
@@ -135,31 +146,33 @@ def _validate_model(
     ) in ds_iter:
         all_labels.append(labels)
         enc_kmers = encoded_kmers.compute_encoded_kmer_batch(
-            bb, ab, seqs, seq_maps, seq_lens
+            bb, ab, seqs, seq_maps, seq_lens, out=enc_kmers_buf
         )
         if is_torch_model:
+            # compute loss and probabilities on the model device and only
+            # copy probabilities back
             sigs = torch.from_numpy(sigs).to(device)
             enc_kmers = torch.from_numpy(enc_kmers).to(device)
-            output = model(sigs, enc_kmers).detach().cpu().numpy()
+            output = add_unmodeled_labels(
+                model(sigs, enc_kmers).float(), unmodeled_labels
+            )
+            loss = criterion(output, torch.from_numpy(labels).to(device))
+            probs = torch.softmax(output, dim=1).cpu().numpy()
         else:
             output = model.run([], {"sig": sigs, "seq": enc_kmers})[0]
-        output = add_unmodeled_labels(output, unmodeled_labels)
-        all_outputs.append(output)
-        all_loss.append(
-            criterion(torch.from_numpy(output), torch.from_numpy(labels))
-            .detach()
-            .cpu()
-            .numpy()
-        )
+            output = add_unmodeled_labels(output, unmodeled_labels)
+            loss = criterion(torch.from_numpy(output), torch.from_numpy(labels))
+            probs = softmax_axis1(output)
+        all_probs.append(probs)
+        all_loss.append(loss.item())
         if full_results_fh is not None:
             full_results_fh.write_results(
-                output, labels, read_ids, read_focus_bases
+                probs, labels, read_ids, read_focus_bases
             )
-    all_outputs = np.concatenate(all_outputs, axis=0)
+    all_probs = np.concatenate(all_probs, axis=0)
     all_labels = np.concatenate(all_labels)
     if is_torch_model:
         torch.set_grad_enabled(True)
-    all_probs = softmax_axis1(all_outputs)
     acc, conf_mat, filt_frac, filt_acc, filt_conf_mat = compute_metrics(
         all_probs, all_labels, filt_frac
     )
@@ -220,32 +233,38 @@ def process_mods_probs(probs, labels, allow_unbalanced, pct_filt, name):
 
 
 class ResultsWriter:
+    COLUMNS = (
+        "read_id",
+        "read_focus_base",
+        "label",
+        "class_pred",
+        "class_probs",
+    )
+
     def __init__(self, out_fh):
         self.sep = "\t"
         self.out_fh = out_fh
-        df = pd.DataFrame(
-            columns=[
-                "read_id",
-                "read_focus_base",
-                "label",
-                "class_pred",
-                "class_probs",
-            ]
+        self.out_fh.write(self.sep.join(self.COLUMNS) + "\n")
+
+    def write_results(self, probs, labels, read_ids, read_focus_bases):
+        class_preds = probs.argmax(axis=1)
+        # convert whole arrays to strings within numpy and write the batch
+        # with a single call
+        str_probs = probs.astype(str).tolist()
+        sep = self.sep
+        self.out_fh.write(
+            "".join(
+                f"{read_id}{sep}{focus_base}{sep}{label}{sep}{pred}{sep}"
+                f"{','.join(read_probs)}\n"
+                for read_id, focus_base, label, pred, read_probs in zip(
+                    read_ids.tolist(),
+                    read_focus_bases.tolist(),
+                    labels.tolist(),
+                    class_preds.tolist(),
+                    str_probs,
+                )
+            )
         )
-        df.to_csv(self.out_fh, sep=self.sep, index=False)
-
-    def write_results(self, output, labels, read_ids, read_focus_bases):
-        class_preds = output.argmax(axis=1)
-        str_probs = [",".join(map(str, r)) for r in softmax_axis1(output)]
-        pd.DataFrame(
-            {
-                "read_id": read_ids,
-                "read_focus_base": read_focus_bases,
-                "label": labels,
-                "class_pred": class_preds,
-                "class_probs": str_probs,
-            }
-        ).to_csv(self.out_fh, header=False, index=False, sep=self.sep)
 
 
 class ValidationLogger:
@@ -317,7 +336,20 @@ def parse_mod_read(
     max_sites=None,
 ):
     strand = "-" if read.is_reverse else "+"
-    ctg_gt = gt_sites.get((read.reference_name, strand))
+    ctg_gt = None
+    cs_gt = gt_sites.get((read.reference_name, strand))
+    if cs_gt is not None:
+        # lookup table for ground truth sites covered by this read
+        gt_poss, gt_mods = cs_gt
+        read_st, read_en = np.searchsorted(
+            gt_poss, (read.reference_start, read.reference_end)
+        )
+        ctg_gt = dict(
+            zip(
+                gt_poss[read_st:read_en].tolist(),
+                gt_mods[read_st:read_en].tolist(),
+            )
+        )
     ctg_gt_range = gt_ranges.get((read.reference_name, strand))
 
     aligned_pairs = read.get_aligned_pairs(with_seq=True)
@@ -468,10 +500,10 @@ def parse_mod_bam(
 
     Arsg:
         bam_path (str): Path to mapped BAM file with modified base tags
-        gt_sites (dict): First level keys are chromosome and strand 2-tuples,
-            second level keys are reference positions pointing to a ground truth
-            modified base single letter code.
-        gt_ranges (dict): Min and max values from gt_sites dict values
+        gt_sites (dict): Keys are chromosome and strand 2-tuples, values are
+            sorted reference positions and the ground truth modified base
+            single letter code at each position (see io.parse_mods_bed).
+        gt_ranges (dict): Min and max positions from gt_sites values
         alphabet (str): Canonical base followed by modified bases found in
             ground truth data. Other modified bases in BAM file will be ignored.
         full_fh (File): File handle to write full results.
@@ -539,7 +571,11 @@ def validate_modbams(
 
     full_fh = None
     if full_results_path is not None:
-        full_fh = open(full_results_path, "w", buffering=512)
+        full_fh = open(
+            full_results_path,
+            "w",
+            buffering=constants.FULL_RESULTS_BUFFER_SIZE,
+        )
         atexit.register(full_fh.close)
         full_fh.write(
             "query_name\tquery_pos\tref_name\tref_pos\tstrand\t"
@@ -559,14 +595,16 @@ def validate_modbams(
         except KeyError:
             gt_sites, samp_mods = parse_mods_bed(bed_path)
             parsed_gt_sites[bed_path] = (gt_sites, samp_mods)
-            tot_sites = sum(len(cs_sites) for cs_sites in gt_sites.values())
+            tot_sites = sum(cs_poss.size for cs_poss, _ in gt_sites.values())
             LOGGER.info(
                 f"Parsed {tot_sites} total sites with labels {samp_mods} "
                 f"from {bed_path}"
             )
         all_gt_sites.append(gt_sites)
         all_gt_ranges.append(
-            dict((cs, (min(poss), max(poss))) for cs, poss in gt_sites.items())
+            dict(
+                (cs, (poss[0], poss[-1])) for cs, (poss, _) in gt_sites.items()
+            )
         )
         all_mods.update(samp_mods)
     if extra_bases is not None:
@@ -435,6 +435,50 @@ def can_modbam_old_tags(tmpdir_factory, can_modbam):
     return out_file
 
 
+def write_md_reference(in_bam_path, out_bam_path, fasta_path):
+    """Write mapped records from in_bam_path to out_bam_path, each moved to
+    the start of its own contig, along with the reference sequence for these
+    contigs reconstructed from the record MD tags. This produces a small
+    FASTA matching the MD tags instead of the full reference.
+    """
+    recs, ref_seqs = [], []
+    with pysam.AlignmentFile(in_bam_path, "rb", check_sq=False) as in_bam:
+        header = in_bam.header.to_dict()
+        for aln in in_bam:
+            if aln.is_unmapped or not aln.has_tag("MD"):
+                continue
+            recs.append(aln.to_dict())
+            ref_seqs.append(aln.get_reference_sequence().upper())
+    header["SQ"] = [
+        {"SN": f"ctg{rec_idx}", "LN": len(ref_seq)}
+        for rec_idx, ref_seq in enumerate(ref_seqs)
+    ]
+    out_header = pysam.AlignmentHeader.from_dict(header)
+    with pysam.AlignmentFile(out_bam_path, "wb", header=out_header) as out_bam:
+        for rec_idx, rec in enumerate(recs):
+            rec.update(
+                ref_name=f"ctg{rec_idx}",
+                ref_pos="1",
+                next_ref_name="*",
+                next_ref_pos="0",
+            )
+            out_bam.write(pysam.AlignedSegment.from_dict(rec, out_header))
+    with open(fasta_path, "w") as fasta_fh:
+        for rec_idx, ref_seq in enumerate(ref_seqs):
+            fasta_fh.write(f">ctg{rec_idx}\n{ref_seq}\n")
+    pysam.faidx(str(fasta_path))
+
+
+@pytest.fixture(scope="session")
+def can_mappings_md_reference(tmpdir_factory, can_mappings):
+    """Canonical mappings bam file and matching indexed reference FASTA"""
+    out_dir = tmpdir_factory.mktemp("remora_tests")
+    out_bam = out_dir / "can_mappings_md_ref.bam"
+    out_fasta = out_dir / "can_md_ref.fa"
+    write_md_reference(can_mappings, out_bam, out_fasta)
+    return out_bam, out_fasta
+
+
 @pytest.fixture(scope="session")
 def mod_modbam(tmpdir_factory, mod_pod5, mod_mappings, pretrain_model_args):
     out_dir = tmpdir_factory.mktemp("remora_tests")
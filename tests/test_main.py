@@ -1,13 +1,21 @@
 """ Test main module.
 """
+import shutil
 from pathlib import Path
 from subprocess import check_call
 
+import pod5
 import pysam
+import torch
 import pytest
+import numpy as np
 
-from remora.data_chunks import RemoraDataset
-from remora import io
+from remora.data_chunks import (
+    RemoraDataset,
+    pad_batch_size,
+    run_model_on_batches,
+)
+from remora import io, model_util
 
 pytestmark = pytest.mark.main
 
@@ -68,6 +76,152 @@ def test_remora_dataset(chunks):
     assert dict(dataset.get_label_counts()) == {1: 75, 0: 75}
 
 
+###############
+# BED parsing #
+###############
+
+
+@pytest.mark.unit
+def test_parse_bed_field_counts(tmpdir_factory):
+    out_dir = tmpdir_factory.mktemp("remora_tests")
+    three_field_bed = out_dir / "three_field.bed"
+    with open(three_field_bed, "w") as bed_fh:
+        bed_fh.write("ctg1\t10\t13\nctg1\t12\t14\n")
+    assert sorted(io.parse_bed(three_field_bed)) == [
+        ("ctg1", "+"),
+        ("ctg1", "-"),
+    ]
+    for strand in "+-":
+        assert io.parse_bed(three_field_bed)[("ctg1", strand)].tolist() == [
+            10,
+            11,
+            12,
+            13,
+        ]
+
+    # 18 field bedMethyl rows mixed with shorter rows
+    wide_bed = out_dir / "wide.bed"
+    bed_methyl_fields = "\t".join(["0,0,0"] + ["10"] * 11)
+    with open(wide_bed, "w") as bed_fh:
+        bed_fh.write(f"ctg1\t10\t12\tm\t0\t+\t{bed_methyl_fields}\n")
+        bed_fh.write("ctg1\t11\t12\th\n")
+        bed_fh.write(f"ctg2\t5\t6\tm\t0\t-\t{bed_methyl_fields}\n")
+    regs = io.parse_bed(wide_bed)
+    assert regs[("ctg1", "+")].tolist() == [10, 11]
+    assert regs[("ctg1", "-")].tolist() == [11]
+    assert regs[("ctg2", "-")].tolist() == [5]
+    assert ("ctg2", "+") not in regs
+
+    mod_regs, all_mods = io.parse_mods_bed(wide_bed)
+    assert all_mods == {"m", "h"}
+    poss, mods = mod_regs[("ctg1", "+")]
+    assert poss.tolist() == [10, 11]
+    # later intervals take precedence
+    assert mods.tolist() == ["m", "h"]
+    assert mod_regs[("ctg2", "-")][1].tolist() == ["m"]
+
+
+@pytest.mark.unit
+def test_parse_bed_zero_length(tmpdir_factory):
+    out_dir = tmpdir_factory.mktemp("remora_tests")
+    zero_len_bed = out_dir / "zero_length.bed"
+    with open(zero_len_bed, "w") as bed_fh:
+        bed_fh.write("ctg1\t10\t10\tm\t0\t+\n")
+        bed_fh.write("ctg2\t5\t5\th\t0\t+\n")
+        bed_fh.write("ctg2\t7\t8\tm\t0\t+\n")
+    # contigs and strands covering no positions are not included
+    assert sorted(io.parse_bed(zero_len_bed)) == [("ctg2", "+")]
+    mod_regs, all_mods = io.parse_mods_bed(zero_len_bed)
+    assert sorted(mod_regs) == [("ctg2", "+")]
+    assert mod_regs[("ctg2", "+")][0].tolist() == [7]
+    assert all_mods == {"m", "h"}
+
+
+################
+# BAM indexing #
+################
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("skip_non_primary", [True, False])
+def test_index_bam_shards(monkeypatch, simplex_alignments, skip_non_primary):
+    seq_idx, seq_num_recs = io.index_bam(
+        simplex_alignments, skip_non_primary, num_workers=1
+    )
+    # force several small shards so shard starts fall within records
+    monkeypatch.setattr(io, "MIN_BAM_INDEX_SHARD_SIZE", 1)
+    assert len(io._index_bam_shard_blocks(simplex_alignments, 4)) > 1
+    shard_idx, shard_num_recs = io.index_bam(
+        simplex_alignments, skip_non_primary, num_workers=4
+    )
+    assert shard_num_recs == seq_num_recs
+    assert list(shard_idx) == list(seq_idx)
+    assert all(shard_idx[read_id] == seq_idx[read_id] for read_id in seq_idx)
+
+
+############
+# IO reads #
+############
+
+
+@pytest.mark.unit
+def test_read_copy():
+    read = io.Read(
+        read_id="read1",
+        signal=np.arange(10, dtype=np.int16),
+        seq="ACGT",
+        ref_pos=io.RefPos(ctg="ctg1", strand="+", start=5),
+        full_align_str="read1\t0\tctg1\t6",
+    )
+    read_copy = read.copy()
+    for name in io.Read.__slots__:
+        assert getattr(read_copy, name) is getattr(read, name)
+
+    read_copy.read_id = "read2"
+    read_copy.signal = np.zeros(3, dtype=np.int16)
+    read_copy.seq = "TTTT"
+    read_copy.ref_pos = io.RefPos(ctg="ctg2", strand="-", start=0)
+    read_copy.full_align_str = "read2\t16\tctg2\t1"
+    assert read.read_id == "read1"
+    assert read.signal.tolist() == list(range(10))
+    assert read.seq == "ACGT"
+    assert read.ref_pos == io.RefPos(ctg="ctg1", strand="+", start=5)
+    assert read.full_align_str == "read1\t0\tctg1\t6"
+
+
+@pytest.mark.unit
+def test_read_calibration(can_pod5, can_mappings):
+    with pysam.AlignmentFile(can_mappings, "rb", check_sq=False) as bam_fh:
+        alignments = dict((aln.query_name, aln) for aln in bam_fh)
+    num_checked = 0
+    with pod5.Reader(can_pod5) as pod5_fh:
+        for pod5_read in pod5_fh.reads():
+            read_id = str(pod5_read.read_id)
+            if read_id not in alignments:
+                continue
+            read = io.Read.from_pod5_and_alignment(
+                pod5_read, alignments[read_id]
+            )
+            assert read.scale_dacs_to_pa == pod5_read.calibration.scale
+            assert read.shift_dacs_to_pa == pod5_read.calibration.offset
+
+            signal_pa = io.Read.convert_signal_to_pA(
+                pod5_read.signal,
+                scale_dacs_to_pa=pod5_read.calibration.scale,
+                offset_dacs_to_pa=pod5_read.calibration.offset,
+            )
+            assert np.allclose(
+                io.Read.compute_pa_to_norm_scaling_from_dacs(
+                    pod5_read.signal,
+                    scale_dacs_to_pa=pod5_read.calibration.scale,
+                    offset_dacs_to_pa=pod5_read.calibration.offset,
+                ),
+                io.Read.compute_pa_to_norm_scaling(signal_pa),
+            )
+            num_checked += 1
+    assert num_checked > 0
+
+
 ##################
 # Mod Prediction #
 ##################
@@ -119,6 +273,141 @@ def test_mod_infer(tmpdir_factory, can_pod5, can_mappings, fw_mod_model_dir):
     )
 
 
+@pytest.mark.unit
+def test_load_model_half_cpu(caplog, fw_mod_model_dir):
+    # half precision is only applied on GPU; CPU falls back to full precision
+    model, _ = model_util.load_model(
+        str(fw_mod_model_dir / FINAL_MODEL_FILENAME), half=True
+    )
+    assert all(param.dtype == torch.float32 for param in model.parameters())
+    assert "Half precision inference requires a GPU device" in caplog.text
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="requires CUDA")
+def test_run_model_on_batches_gpu(monkeypatch, fw_mod_model_dir):
+    monkeypatch.setattr(torch.backends.cudnn, "deterministic", True)
+    model, model_metadata = model_util.load_model(
+        str(fw_mod_model_dir / FINAL_MODEL_FILENAME), device=0
+    )
+    bb, ab = model_metadata["kmer_context_bases"]
+    sig_len = sum(model_metadata["chunk_context"])
+    batch_size = 64
+    rng = np.random.default_rng(0)
+    # full batches followed by partial batches of several sizes
+    batches = [
+        (
+            rng.standard_normal((nchunks, 1, sig_len), dtype=np.float32),
+            rng.integers(0, 2, (nchunks, 4 * (bb + ab + 1), sig_len)).astype(
+                np.float32
+            ),
+        )
+        for nchunks in (batch_size, batch_size, 17, batch_size, 3, 40)
+    ]
+    num_chunks = sum(sigs.shape[0] for sigs, _ in batches)
+    outputs = run_model_on_batches(model, batches, num_chunks, batch_size)
+
+    # single stream reference with the same padded input shapes
+    device = torch.device("cuda", 0)
+    exp_outputs = []
+    with torch.inference_mode():
+        for sigs, enc_kmers in batches:
+            nchunks = sigs.shape[0]
+            pad_size = pad_batch_size(nchunks, batch_size)
+            pad_sigs, pad_enc_kmers = (
+                torch.zeros(
+                    (pad_size,) + arr.shape[1:], dtype=torch.float32
+                ).to(device)
+                for arr in (sigs, enc_kmers)
+            )
+            pad_sigs[:nchunks] = torch.from_numpy(sigs).to(device)
+            pad_enc_kmers[:nchunks] = torch.from_numpy(enc_kmers).to(device)
+            exp_outputs.append(
+                model.forward(sigs=pad_sigs, seqs=pad_enc_kmers)[:nchunks]
+                .float()
+                .cpu()
+                .numpy()
+            )
+    assert np.array_equal(outputs, np.concatenate(exp_outputs))
+
+
+def read_bam_records(bam_path):
+    with pysam.AlignmentFile(bam_path, "rb", check_sq=False) as bam_fh:
+        return str(bam_fh.header), [rec.to_string() for rec in bam_fh]
+
+
+@pytest.mark.unit
+def test_mod_infer_cached_bam_index(
+    tmpdir_factory, can_pod5, can_mappings, fw_mod_model_dir
+):
+    out_dir = tmpdir_factory.mktemp("remora_tests")
+    print(f"Output dir: {out_dir}")
+    # copy mappings so the BAM index is saved in the test output dir
+    in_bam = out_dir / "can_mappings.bam"
+    shutil.copy(can_mappings, in_bam)
+    out_paths = []
+    for run_idx in range(2):
+        out_path = out_dir / f"mod_infer_cached_{run_idx}.bam"
+        log_path = out_dir / f"mod_infer_cached_{run_idx}.log"
+        check_call(
+            [
+                "remora",
+                "infer",
+                "from_pod5_and_bam",
+                can_pod5,
+                in_bam,
+                "--model",
+                str(fw_mod_model_dir / FINAL_MODEL_FILENAME),
+                "--out-bam",
+                out_path,
+                "--log-filename",
+                log_path,
+                "--cache-bam-index",
+            ],
+        )
+        out_paths.append(out_path)
+        assert len(list(out_dir.listdir("*.remora_idx.npz"))) == 1
+    # second run must load the index saved by the first run
+    assert "Loaded BAM index" in log_path.read()
+    assert read_bam_records(out_paths[0]) == read_bam_records(out_paths[1])
+
+
+@pytest.mark.unit
+def test_mod_infer_reference_fasta(
+    tmpdir_factory, can_pod5, can_mappings_md_reference, fw_mod_model_dir
+):
+    in_bam, ref_fasta = can_mappings_md_reference
+    out_dir = tmpdir_factory.mktemp("remora_tests")
+    print(f"Output dir: {out_dir}")
+    out_paths = []
+    for ref_name, ref_args in (
+        ("md", []),
+        ("fasta", ["--reference-fasta", ref_fasta]),
+    ):
+        out_path = out_dir / f"mod_infer_ref_{ref_name}.bam"
+        check_call(
+            [
+                "remora",
+                "infer",
+                "from_pod5_and_bam",
+                can_pod5,
+                in_bam,
+                "--model",
+                str(fw_mod_model_dir / FINAL_MODEL_FILENAME),
+                "--out-bam",
+                out_path,
+                "--log-filename",
+                out_dir / f"mod_infer_ref_{ref_name}.log",
+                "--reference-anchored",
+                *ref_args,
+            ],
+        )
+        out_paths.append(out_path)
+    md_header, md_recs = read_bam_records(out_paths[0])
+    assert len(md_recs) > 0
+    assert read_bam_records(out_paths[1]) == (md_header, md_recs)
+
+
 @pytest.mark.unit
 @pytest.mark.duplex
 def test_mod_infer_duplex(